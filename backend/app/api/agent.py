@@ -17,7 +17,7 @@ from app.api import board_onboarding as onboarding_api
 from app.api import tasks as tasks_api
 from app.api.deps import ActorContext, get_board_or_404, get_task_or_404
 from app.core.agent_auth import AgentAuthContext, get_agent_auth_context
-from app.db.pagination import paginate
+from app.db.pagination import KeysetParams, keyset_params, paginate
 from app.db.session import get_session
 from app.models.agents import Agent
 from app.models.boards import Board
@@ -45,7 +45,7 @@ from app.schemas.gateway_coordination import (
     GatewayMainAskUserResponse,
 )
 from app.schemas.health import AgentHealthStatusResponse
-from app.schemas.pagination import DefaultLimitOffsetPage
+from app.schemas.pagination import DefaultKeysetPage, DefaultLimitOffsetPage
 from app.schemas.tags import TagRef
 from app.schemas.tasks import TaskCommentCreate, TaskCommentRead, TaskCreate, TaskRead, TaskUpdate
 from app.services.activity_log import record_activity
@@ -62,11 +62,11 @@ from app.services.task_dependencies import (
 if TYPE_CHECKING:
     from collections.abc import Sequence
 
+    from fastapi.responses import ORJSONResponse
     from fastapi_pagination.limit_offset import LimitOffsetPage
     from sqlmodel.ext.asyncio.session import AsyncSession
 
     from app.models.activity_events import ActivityEvent
-    from app.models.board_memory import BoardMemory
     from app.models.board_onboarding import BoardOnboardingSession
 
 router = APIRouter(prefix="/agent", tags=["agent"])
@@ -78,6 +78,7 @@ BOARD_ID_QUERY = Query(default=None)
 TASK_STATUS_QUERY = Query(default=None, alias="status")
 IS_CHAT_QUERY = Query(default=None)
 APPROVAL_STATUS_QUERY = Query(default=None, alias="status")
+KEYSET_PARAMS_DEP = Depends(keyset_params)
 
 AGENT_LEAD_TAGS = cast("list[str | Enum]", ["agent-lead"])
 AGENT_MAIN_TAGS = cast("list[str | Enum]", ["agent-main"])
@@ -932,7 +933,7 @@ async def create_task_comment(
 
 @router.get(
     "/boards/{board_id}/memory",
-    response_model=DefaultLimitOffsetPage[BoardMemoryRead],
+    response_model=DefaultKeysetPage[BoardMemoryRead],
     tags=AGENT_BOARD_TAGS,
     openapi_extra=_agent_board_openapi_hints(
         intent="agent_board_memory_discovery",
@@ -956,7 +957,8 @@ async def list_board_memory(
     board: Board = BOARD_DEP,
     session: AsyncSession = SESSION_DEP,
     agent_ctx: AgentAuthContext = AGENT_CTX_DEP,
-) -> LimitOffsetPage[BoardMemoryRead]:
+    params: KeysetParams = KEYSET_PARAMS_DEP,
+) -> ORJSONResponse:
     """List board memory with optional chat filtering.
 
     Use `is_chat=false` for durable context and `is_chat=true` for board chat.
@@ -967,6 +969,7 @@ async def list_board_memory(
         board=board,
         session=session,
         _actor=_actor(agent_ctx),
+        params=params,
     )
 
 
@@ -998,7 +1001,7 @@ async def create_board_memory(
     board: Board = BOARD_DEP,
     session: AsyncSession = SESSION_DEP,
     agent_ctx: AgentAuthContext = AGENT_CTX_DEP,
-) -> BoardMemory:
+) -> ORJSONResponse:
     """Create a board memory entry.
 
     Use tags to indicate purpose (e.g. `chat`, `decision`, `plan`, `handoff`).
@@ -1014,7 +1017,7 @@ async def create_board_memory(
 
 @router.get(
     "/boards/{board_id}/approvals",
-    response_model=DefaultLimitOffsetPage[ApprovalRead],
+    response_model=DefaultKeysetPage[ApprovalRead],
     tags=AGENT_BOARD_TAGS,
     openapi_extra=_agent_board_openapi_hints(
         intent="agent_board_approval_discovery",
@@ -1038,7 +1041,8 @@ async def list_approvals(
     board: Board = BOARD_DEP,
     session: AsyncSession = SESSION_DEP,
     agent_ctx: AgentAuthContext = AGENT_CTX_DEP,
-) -> LimitOffsetPage[ApprovalRead]:
+    params: KeysetParams = KEYSET_PARAMS_DEP,
+) -> DefaultKeysetPage[ApprovalRead]:
     """List approvals for a board.
 
     Use status filtering to process pending approvals efficiently.
@@ -1049,6 +1053,7 @@ async def list_approvals(
         board=board,
         session=session,
         _actor=_actor(agent_ctx),
+        params=params,
     )
 
 
@@ -3,14 +3,17 @@
 from __future__ import annotations
 
 import asyncio
-import json
+import time
+from contextlib import suppress
+from dataclasses import dataclass
 from datetime import UTC, datetime
 from typing import TYPE_CHECKING
 from uuid import UUID
 
 from fastapi import APIRouter, Depends, HTTPException, Query, Request, status
-from sqlalchemy import asc, func, or_
+from sqlalchemy import asc, bindparam, func, or_
 from sqlmodel import col, select
+from sse_starlette.event import ServerSentEvent
 from sse_starlette.sse import EventSourceResponse
 
 from app.api.deps import (
@@ -20,18 +23,28 @@ from app.api.deps import (
     get_board_for_user_write,
     require_admin_or_agent,
 )
+from app.core.background import spawn_background
 from app.core.logging import get_logger
 from app.core.time import utcnow
-from app.db.pagination import paginate
+from app.db.notifications import APPROVALS_CHANNEL, notification_listener
+from app.db.pagination import KeysetParams, keyset_paginate, keyset_params
 from app.db.session import async_session_maker, get_session
 from app.models.agents import Agent
 from app.models.approvals import Approval
 from app.models.tasks import Task
-from app.schemas.approvals import ApprovalCreate, ApprovalRead, ApprovalStatus, ApprovalUpdate
-from app.schemas.pagination import DefaultLimitOffsetPage
+from app.schemas.approvals import (
+    ApprovalCreate,
+    ApprovalRead,
+    ApprovalStatus,
+    ApprovalStreamEvent,
+    ApprovalTaskCounts,
+    ApprovalUpdate,
+)
+from app.schemas.pagination import DefaultKeysetPage
 from app.services.activity_log import record_activity
 from app.services.approval_task_links import (
     load_task_ids_by_approval,
+    load_task_links_by_approval,
     lock_tasks_for_approval,
     normalize_task_ids,
     pending_approval_conflicts_by_task,
@@ -43,23 +56,49 @@ from app.services.openclaw.gateway_dispatch import GatewayDispatchService
 if TYPE_CHECKING:
     from collections.abc import AsyncIterator, Sequence
 
-    from fastapi_pagination.limit_offset import LimitOffsetPage
     from sqlmodel.ext.asyncio.session import AsyncSession
 
     from app.models.boards import Board
+    from app.services.openclaw.gateway_rpc import GatewayConfig as GatewayClientConfig
 
 router = APIRouter(prefix="/boards/{board_id}/approvals", tags=["approvals"])
 logger = get_logger(__name__)
 
 STREAM_POLL_SECONDS = 2
+PENDING_COUNT_TTL_SECONDS = 1.0
+SUBSCRIBER_QUEUE_MAXSIZE = 256
+GATEWAY_CONFIG_TTL_SECONDS = 30.0
 STATUS_FILTER_QUERY = Query(default=None, alias="status")
 SINCE_QUERY = Query(default=None)
+KEYSET_PARAMS_DEP = Depends(keyset_params)
 BOARD_READ_DEP = Depends(get_board_for_actor_read)
 BOARD_WRITE_DEP = Depends(get_board_for_actor_write)
 BOARD_USER_WRITE_DEP = Depends(get_board_for_user_write)
 SESSION_DEP = Depends(get_session)
 ACTOR_DEP = Depends(require_admin_or_agent)
 
+# Per-board pending approval counts shared by every stream on this process, as
+# `board_id -> (count, loaded_at)`. Local writes invalidate eagerly, and approval
+# NOTIFYs invalidate writes from other workers before their poll runs; the TTL only
+# bounds staleness while the listener is disconnected.
+_pending_counts: dict[UUID, tuple[int, float]] = {}
+
+
+@dataclass(frozen=True, slots=True)
+class _LeadNotifyTarget:
+    agent_id: UUID
+    agent_name: str
+    session_key: str
+    config: GatewayClientConfig
+
+
+# Resolved gateway config per board as `(board_id, gateway_id) -> (config, loaded_at)`.
+# Keying on the gateway id means a board re-pointed at another gateway misses at once;
+# local gateway edits invalidate their entries, and a failed send drops its entry.
+# Boards without a gateway are not cached, and the lead itself is re-read each time: a
+# reassigned lead keeps a valid session key, so a stale one would never fail a send.
+_gateway_configs: dict[tuple[UUID, UUID], tuple[GatewayClientConfig, float]] = {}
+
 
 def _parse_since(value: str | None) -> datetime | None:
     if not value:
@@ -81,22 +120,6 @@ def _approval_updated_at(approval: Approval) -> datetime:
     return approval.resolved_at or approval.created_at
 
 
-async def _approval_task_ids_map(
-    session: AsyncSession,
-    approvals: Sequence[Approval],
-) -> dict[UUID, list[UUID]]:
-    approval_ids = [approval.id for approval in approvals]
-    mapping = await load_task_ids_by_approval(session, approval_ids=approval_ids)
-    for approval in approvals:
-        if mapping.get(approval.id):
-            continue
-        if approval.task_id is not None:
-            mapping[approval.id] = [approval.task_id]
-        else:
-            mapping[approval.id] = []
-    return mapping
-
-
 async def _task_titles_by_id(
     session: AsyncSession,
     *,
@@ -132,24 +155,41 @@ def _approval_to_read(
 async def _approval_reads(
     session: AsyncSession,
     approvals: Sequence[Approval],
+    *,
+    links_by_approval: dict[UUID, list[tuple[UUID, str | None]]] | None = None,
 ) -> list[ApprovalRead]:
-    mapping = await _approval_task_ids_map(session, approvals)
-    title_by_id = await _task_titles_by_id(
-        session,
-        task_ids={task_id for task_ids in mapping.values() for task_id in task_ids},
-    )
-    return [
-        _approval_to_read(
-            approval,
-            task_ids=(task_ids := mapping.get(approval.id, [])),
-            task_titles=[title_by_id[task_id] for task_id in task_ids if task_id in title_by_id],
+    if links_by_approval is None:
+        links_by_approval = await load_task_links_by_approval(
+            session,
+            approval_ids=[approval.id for approval in approvals],
         )
-        for approval in approvals
-    ]
+    reads: list[ApprovalRead] = []
+    for approval in approvals:
+        links = links_by_approval.get(approval.id, [])
+        reads.append(
+            _approval_to_read(
+                approval,
+                task_ids=[task_id for task_id, _title in links],
+                task_titles=[title for _task_id, title in links if title is not None],
+            ),
+        )
+    return reads
+
+
+def _stream_task_counts(
+    task_ids: Sequence[UUID],
+    counts_by_task: dict[UUID, ApprovalTaskCounts],
+) -> ApprovalTaskCounts | list[ApprovalTaskCounts] | None:
+    counts = [counts_by_task[task_id] for task_id in task_ids if task_id in counts_by_task]
+    if len(counts) == 1:
+        return counts[0]
+    return counts or None
 
 
-def _serialize_approval(approval: ApprovalRead) -> dict[str, object]:
-    return approval.model_dump(mode="json")
+def _encode_stream_event(event: ApprovalStreamEvent) -> ServerSentEvent:
+    # pydantic-core writes the JSON directly; `task_counts` is omitted rather than null.
+    exclude = {"task_counts"} if event.task_counts is None else None
+    return ServerSentEvent(event="approval", data=event.model_dump_json(exclude=exclude))
 
 
 def _pending_conflict_detail(conflicts: dict[UUID, UUID]) -> dict[str, object]:
@@ -190,31 +230,44 @@ async def _ensure_no_pending_approval_conflicts(
         )
 
 
+_RESOLUTION_MESSAGE_TEMPLATE = (
+    "APPROVAL RESOLVED\n"
+    "Board: {board_name}\n"
+    "Approval ID: {approval_id}\n"
+    "Action: {action_type}\n"
+    "Decision: {decision}\n"
+    "Confidence: {confidence}\n"
+    "{task_line}"
+    "\n"
+    "Take action: continue execution using the final approval decision."
+)
+
+
 def _approval_resolution_message(
     *,
     board: Board,
     approval: Approval,
     task_ids: Sequence[UUID] | None = None,
 ) -> str:
-    status_text = "approved" if approval.status == "approved" else "rejected"
-    lines = [
-        "APPROVAL RESOLVED",
-        f"Board: {board.name}",
-        f"Approval ID: {approval.id}",
-        f"Action: {approval.action_type}",
-        f"Decision: {status_text}",
-        f"Confidence: {approval.confidence}",
-    ]
     normalized_task_ids = list(task_ids or [])
     if not normalized_task_ids and approval.task_id is not None:
         normalized_task_ids = [approval.task_id]
     if len(normalized_task_ids) == 1:
-        lines.append(f"Task ID: {normalized_task_ids[0]}")
+        task_line = f"Task ID: {normalized_task_ids[0]}\n"
     elif normalized_task_ids:
-        lines.append(f"Task IDs: {', '.join(str(value) for value in normalized_task_ids)}")
-    lines.append("")
-    lines.append("Take action: continue execution using the final approval decision.")
-    return "\n".join(lines)
+        task_line = f"Task IDs: {', '.join(str(value) for value in normalized_task_ids)}\n"
+    else:
+        task_line = ""
+    return _RESOLUTION_MESSAGE_TEMPLATE.format_map(
+        {
+            "board_name": board.name,
+            "approval_id": approval.id,
+            "action_type": approval.action_type,
+            "decision": "approved" if approval.status == "approved" else "rejected",
+            "confidence": approval.confidence,
+            "task_line": task_line,
+        },
+    )
 
 
 async def _resolve_board_lead(
@@ -229,6 +282,46 @@ async def _resolve_board_lead(
     )
 
 
+async def _board_gateway_config(
+    session: AsyncSession,
+    board: Board,
+) -> GatewayClientConfig | None:
+    """Return the board's gateway config, served from a short-lived cache."""
+    if board.gateway_id is None:
+        return None
+    key = (board.id, board.gateway_id)
+    now = time.monotonic()
+    cached = _gateway_configs.get(key)
+    if cached is not None and now - cached[1] < GATEWAY_CONFIG_TTL_SECONDS:
+        return cached[0]
+    config = await GatewayDispatchService(session).optional_gateway_config_for_board(board)
+    if config is not None:
+        _gateway_configs[key] = (config, now)
+    return config
+
+
+def invalidate_gateway_configs(gateway_id: UUID) -> None:
+    """Drop cached lead-notification configs for a gateway whose settings changed."""
+    for key in [key for key in _gateway_configs if key[1] == gateway_id]:
+        del _gateway_configs[key]
+
+
+async def _lead_notify_target(session: AsyncSession, board: Board) -> _LeadNotifyTarget | None:
+    """Return where to notify the board lead, if it has a session and a gateway."""
+    lead = await _resolve_board_lead(session, board_id=board.id)
+    if lead is None or not lead.openclaw_session_id:
+        return None
+    config = await _board_gateway_config(session, board)
+    if config is None:
+        return None
+    return _LeadNotifyTarget(
+        agent_id=lead.id,
+        agent_name=lead.name,
+        session_key=lead.openclaw_session_id,
+        config=config,
+    )
+
+
 async def _notify_lead_on_approval_resolution(
     *,
     session: AsyncSession,
@@ -237,13 +330,8 @@ async def _notify_lead_on_approval_resolution(
 ) -> None:
     if approval.status not in {"approved", "rejected"}:
         return
-    lead = await _resolve_board_lead(session, board_id=board.id)
-    if lead is None or not lead.openclaw_session_id:
-        return
-
-    dispatch = GatewayDispatchService(session)
-    config = await dispatch.optional_gateway_config_for_board(board)
-    if config is None:
+    target = await _lead_notify_target(session, board)
+    if target is None:
         return
 
     task_ids_by_approval = await load_task_ids_by_approval(session, approval_ids=[approval.id])
@@ -252,10 +340,10 @@ async def _notify_lead_on_approval_resolution(
         approval=approval,
         task_ids=task_ids_by_approval.get(approval.id, []),
     )
-    error = await dispatch.try_send_agent_message(
-        session_key=lead.openclaw_session_id,
-        config=config,
-        agent_name=lead.name,
+    error = await GatewayDispatchService(session).try_send_agent_message(
+        session_key=target.session_key,
+        config=target.config,
+        agent_name=target.agent_name,
         message=message,
         deliver=False,
     )
@@ -264,50 +352,277 @@ async def _notify_lead_on_approval_resolution(
             session,
             event_type="approval.lead_notified",
             message=f"Lead agent notified for {approval.status} approval {approval.id}.",
-            agent_id=lead.id,
+            agent_id=target.agent_id,
             task_id=approval.task_id,
         )
     else:
+        if board.gateway_id is not None:
+            _gateway_configs.pop((board.id, board.gateway_id), None)
         record_activity(
             session,
             event_type="approval.lead_notify_failed",
             message=f"Lead notify failed for approval {approval.id}: {error}",
-            agent_id=lead.id,
+            agent_id=target.agent_id,
             task_id=approval.task_id,
         )
     await session.commit()
 
 
+async def _notify_lead_in_background(*, board: Board, approval_id: UUID) -> None:
+    async with async_session_maker() as session:
+        # Re-read so a decision reverted before this task runs is not announced.
+        approval = await Approval.objects.by_id(approval_id).first(session)
+        if approval is None or approval.board_id != board.id:
+            return
+        await _notify_lead_on_approval_resolution(
+            session=session,
+            board=board,
+            approval=approval,
+        )
+
+
+def _invalidate_pending_count(board_id: UUID) -> None:
+    _pending_counts.pop(board_id, None)
+
+
+# Per-tick stream statements are built once and re-executed with bound parameters, so
+# SQLAlchemy reuses their memoized cache key and compiled SQL instead of rebuilding them.
+_APPROVAL_EVENTS_CRITERIA = (
+    col(Approval.board_id) == bindparam("board_id"),
+    or_(
+        col(Approval.created_at) >= bindparam("since"),
+        col(Approval.resolved_at) >= bindparam("since"),
+    ),
+)
+_APPROVAL_EVENTS_STATEMENT = (
+    select(Approval).where(*_APPROVAL_EVENTS_CRITERIA).order_by(asc(col(Approval.created_at)))
+)
+# The same query with the board's pending count riding along as an uncorrelated scalar
+# subquery, for ticks whose cached count has expired.
+_APPROVAL_EVENTS_WITH_PENDING_COUNT_STATEMENT = (
+    select(
+        Approval,
+        select(func.count(col(Approval.id)))
+        .where(col(Approval.board_id) == bindparam("board_id"))
+        .where(col(Approval.status) == "pending")
+        .scalar_subquery(),
+    )
+    .where(*_APPROVAL_EVENTS_CRITERIA)
+    .order_by(asc(col(Approval.created_at)))
+)
+
+
 async def _fetch_approval_events(
     session: AsyncSession,
     board_id: UUID,
     since: datetime,
-) -> list[Approval]:
-    statement = (
-        Approval.objects.filter_by(board_id=board_id)
-        .filter(
-            or_(
-                col(Approval.created_at) >= since,
-                col(Approval.resolved_at) >= since,
-            ),
-        )
-        .order_by(asc(col(Approval.created_at)))
+) -> tuple[list[Approval], int]:
+    """Return approvals changed since `since` plus the board's pending count.
+
+    Each tick is a single round-trip: the count is served from a short-lived cache
+    and otherwise computed in the same statement as the changed rows.
+    """
+    params = {"board_id": board_id, "since": since}
+    now = time.monotonic()
+    cached = _pending_counts.get(board_id)
+    if cached is not None and now - cached[1] < PENDING_COUNT_TTL_SECONDS:
+        return list(await session.exec(_APPROVAL_EVENTS_STATEMENT, params=params)), cached[0]
+    rows = list(await session.exec(_APPROVAL_EVENTS_WITH_PENDING_COUNT_STATEMENT, params=params))
+    if not rows:
+        # Idle tick: nothing is emitted, so the count is neither needed nor cached.
+        return [], 0
+    count = int(rows[0][1])
+    _pending_counts[board_id] = (count, now)
+    return [approval for approval, _count in rows], count
+
+
+@dataclass(frozen=True, slots=True)
+class _ApprovalStreamItem:
+    approval_id: UUID
+    updated_at: datetime
+    event: ServerSentEvent
+
+    @property
+    def version(self) -> tuple[UUID, datetime]:
+        # An approval is emitted once when created and again when resolved.
+        return self.approval_id, self.updated_at
+
+
+StreamQueue = asyncio.Queue[_ApprovalStreamItem]
+
+
+async def _approval_stream_events(
+    session: AsyncSession,
+    *,
+    board_id: UUID,
+    since: datetime,
+) -> list[_ApprovalStreamItem]:
+    """Build SSE events for approvals changed since `since`, oldest-created first."""
+    approvals, pending_approvals_count = await _fetch_approval_events(session, board_id, since)
+    # Follow-up reads short-circuit without a query on idle ticks.
+    approval_reads = await _approval_reads(session, approvals)
+    task_ids = {task_id for approval_read in approval_reads for task_id in approval_read.task_ids}
+    counts_by_task_id = await task_counts_for_board(
+        session,
+        board_id=board_id,
+        task_ids=task_ids,
     )
-    return await statement.all(session)
+    # Built once per tick; approvals linked to the same task share the model.
+    counts_by_task = {
+        task_id: ApprovalTaskCounts(
+            task_id=task_id,
+            approvals_count=total,
+            approvals_pending_count=pending,
+        )
+        for task_id, (total, pending) in counts_by_task_id.items()
+    }
+    stream_events = [
+        ApprovalStreamEvent(
+            approval=approval_read,
+            pending_approvals_count=pending_approvals_count,
+            task_counts=_stream_task_counts(approval_read.task_ids, counts_by_task),
+        )
+        for approval_read in approval_reads
+    ]
+    return [
+        _ApprovalStreamItem(
+            approval_id=approval.id,
+            updated_at=_approval_updated_at(approval),
+            event=_encode_stream_event(event),
+        )
+        for approval, event in zip(approvals, stream_events, strict=True)
+    ]
+
+
+class _ApprovalStreamPoller:
+    """Single fetch loop per board that fans events out to every subscriber.
+
+    While the NOTIFY listener is connected the loop sleeps until the approvals
+    trigger reports a change for this board; otherwise it falls back to polling.
+    """
+
+    def __init__(self, board_id: UUID) -> None:
+        self.board_id = board_id
+        self.last_seen = utcnow()
+        # Versions already published at `last_seen`; range queries are inclusive of it.
+        self.boundary_versions: set[tuple[UUID, datetime]] = set()
+        self.subscribers: set[StreamQueue] = set()
+        self.task: asyncio.Task[None] | None = None
+        self.wakeup = asyncio.Event()
+        # Events discarded because a subscriber fell SUBSCRIBER_QUEUE_MAXSIZE behind.
+        self.dropped_events = 0
+
+    async def _wait_for_change(self) -> None:
+        timeout = None if notification_listener.connected else STREAM_POLL_SECONDS
+        with suppress(TimeoutError):
+            await asyncio.wait_for(self.wakeup.wait(), timeout=timeout)
+
+    async def run(self) -> None:
+        while self.subscribers:
+            # Cleared before fetching so a change committed mid-fetch triggers another pass.
+            self.wakeup.clear()
+            try:
+                async with async_session_maker() as session:
+                    items = await _approval_stream_events(
+                        session,
+                        board_id=self.board_id,
+                        since=self.last_seen,
+                    )
+            except Exception:
+                logger.exception("approval.stream.poll_failed board_id=%s", self.board_id)
+                items = []
+            self._publish(items)
+            await self._wait_for_change()
+
+    def _publish(self, items: list[_ApprovalStreamItem]) -> None:
+        dropped = 0
+        for item in items:
+            if item.version in self.boundary_versions:
+                continue
+            if item.updated_at > self.last_seen:
+                self.last_seen = item.updated_at
+                self.boundary_versions = set()
+            if item.updated_at == self.last_seen:
+                self.boundary_versions.add(item.version)
+            for queue in self.subscribers:
+                if queue.full():
+                    # Drop-oldest keeps a stalled client from growing memory without bound.
+                    queue.get_nowait()
+                    dropped += 1
+                queue.put_nowait(item)
+        if dropped:
+            self.dropped_events += dropped
+            logger.warning(
+                "approval.stream.subscriber_overflow board_id=%s dropped=%s dropped_total=%s",
+                self.board_id,
+                dropped,
+                self.dropped_events,
+            )
+
+
+_board_pollers: dict[UUID, _ApprovalStreamPoller] = {}
 
 
-@router.get("", response_model=DefaultLimitOffsetPage[ApprovalRead])
+def _on_approval_notification(payload: str | None) -> None:
+    if payload is None:
+        # Notifications may have been missed; no cached count can be trusted.
+        _pending_counts.clear()
+        for board_poller in _board_pollers.values():
+            board_poller.wakeup.set()
+        return
+    board_id, _, _ = payload.partition(":")
+    try:
+        board_uuid = UUID(board_id)
+    except ValueError:
+        logger.warning("approval.stream.bad_notification payload=%s", payload)
+        return
+    # The change may come from another worker, so the cached count is stale either way.
+    _invalidate_pending_count(board_uuid)
+    poller = _board_pollers.get(board_uuid)
+    if poller is not None:
+        poller.wakeup.set()
+
+
+def _subscribe_approval_stream(
+    board_id: UUID,
+) -> tuple[_ApprovalStreamPoller, StreamQueue]:
+    poller = _board_pollers.get(board_id)
+    if poller is None:
+        poller = _ApprovalStreamPoller(board_id)
+        _board_pollers[board_id] = poller
+    notification_listener.add_handler(APPROVALS_CHANNEL, _on_approval_notification)
+    queue: StreamQueue = asyncio.Queue(maxsize=SUBSCRIBER_QUEUE_MAXSIZE)
+    poller.subscribers.add(queue)
+    if poller.task is None or poller.task.done():
+        poller.task = asyncio.create_task(poller.run())
+    return poller, queue
+
+
+def _unsubscribe_approval_stream(
+    poller: _ApprovalStreamPoller,
+    queue: StreamQueue,
+) -> None:
+    poller.subscribers.discard(queue)
+    if poller.subscribers:
+        return
+    if poller.task is not None:
+        poller.task.cancel()
+    if _board_pollers.get(poller.board_id) is poller:
+        del _board_pollers[poller.board_id]
+
+
+@router.get("", response_model=DefaultKeysetPage[ApprovalRead])
 async def list_approvals(
     status_filter: ApprovalStatus | None = STATUS_FILTER_QUERY,
     board: Board = BOARD_READ_DEP,
     session: AsyncSession = SESSION_DEP,
     _actor: ActorContext = ACTOR_DEP,
-) -> LimitOffsetPage[ApprovalRead]:
-    """List approvals for a board, optionally filtering by status."""
+    params: KeysetParams = KEYSET_PARAMS_DEP,
+) -> DefaultKeysetPage[ApprovalRead]:
+    """List approvals for a board newest-first, optionally filtering by status."""
     statement = Approval.objects.filter_by(board_id=board.id)
     if status_filter:
         statement = statement.filter(col(Approval.status) == status_filter)
-    statement = statement.order_by(col(Approval.created_at).desc())
 
     async def _transform(items: Sequence[object]) -> Sequence[ApprovalRead]:
         approvals: list[Approval] = []
@@ -318,7 +633,13 @@ async def list_approvals(
             approvals.append(item)
         return await _approval_reads(session, approvals)
 
-    return await paginate(session, statement.statement, transformer=_transform)
+    return await keyset_paginate(
+        session,
+        statement.statement,
+        model=Approval,
+        params=params,
+        transformer=_transform,
+    )
 
 
 @router.get("/stream")
@@ -329,59 +650,39 @@ async def stream_approvals(
     since: str | None = SINCE_QUERY,
 ) -> EventSourceResponse:
     """Stream approval updates for a board using server-sent events."""
-    since_dt = _parse_since(since) or utcnow()
-    last_seen = since_dt
-
-    async def event_generator() -> AsyncIterator[dict[str, str]]:
-        nonlocal last_seen
-        while True:
-            if await request.is_disconnected():
-                break
-            async with async_session_maker() as session:
-                approvals = await _fetch_approval_events(session, board.id, last_seen)
-                approval_reads = await _approval_reads(session, approvals)
-                pending_approvals_count = int(
-                    (
-                        await session.exec(
-                            select(func.count(col(Approval.id)))
-                            .where(col(Approval.board_id) == board.id)
-                            .where(col(Approval.status) == "pending"),
-                        )
-                    ).one(),
-                )
-                task_ids = {
-                    task_id
-                    for approval_read in approval_reads
-                    for task_id in approval_read.task_ids
-                }
-                counts_by_task_id = await task_counts_for_board(
-                    session,
-                    board_id=board.id,
-                    task_ids=task_ids,
-                )
-            for approval, approval_read in zip(approvals, approval_reads, strict=True):
-                updated_at = _approval_updated_at(approval)
-                last_seen = max(updated_at, last_seen)
-                payload: dict[str, object] = {
-                    "approval": _serialize_approval(approval_read),
-                    "pending_approvals_count": pending_approvals_count,
-                }
-                task_counts = [
-                    {
-                        "task_id": str(task_id),
-                        "approvals_count": total,
-                        "approvals_pending_count": pending,
-                    }
-                    for task_id in approval_read.task_ids
-                    if (counts := counts_by_task_id.get(task_id)) is not None
-                    for total, pending in [counts]
-                ]
-                if len(task_counts) == 1:
-                    payload["task_counts"] = task_counts[0]
-                elif task_counts:
-                    payload["task_counts"] = task_counts
-                yield {"event": "approval", "data": json.dumps(payload)}
-            await asyncio.sleep(STREAM_POLL_SECONDS)
+    since_dt = _parse_since(since)
+
+    async def event_generator() -> AsyncIterator[ServerSentEvent]:
+        poller, queue = _subscribe_approval_stream(board.id)
+        # Versions up to this cursor were published before the queue existed.
+        joined_at, published = poller.last_seen, set(poller.boundary_versions)
+        try:
+            if since_dt is not None and since_dt <= joined_at:
+                # Replay the gap between the client's cursor and the shared poller; later
+                # versions, including unpublished ones at `joined_at`, arrive through the
+                # queue.
+                async with async_session_maker() as session:
+                    items = await _approval_stream_events(
+                        session,
+                        board_id=board.id,
+                        since=since_dt,
+                    )
+                for item in items:
+                    if item.updated_at < joined_at or item.version in published:
+                        yield item.event
+            while True:
+                if await request.is_disconnected():
+                    break
+                try:
+                    item = await asyncio.wait_for(queue.get(), timeout=STREAM_POLL_SECONDS)
+                except TimeoutError:
+                    continue
+                # A client resuming ahead of the shared poller's cursor already has these.
+                if since_dt is not None and item.updated_at < since_dt:
+                    continue
+                yield item.event
+        finally:
+            _unsubscribe_approval_stream(poller, queue)
 
     return EventSourceResponse(event_generator(), ping=15)
 
@@ -424,6 +725,8 @@ async def create_approval(
         task_ids=task_ids,
     )
     await session.commit()
+    if approval.status == "pending":
+        _invalidate_pending_count(board.id)
     await session.refresh(approval)
     title_by_id = await _task_titles_by_id(session, task_ids=set(task_ids))
     return _approval_to_read(
@@ -446,19 +749,20 @@ async def update_approval(
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND)
     updates = payload.model_dump(exclude_unset=True)
     prior_status = approval.status
+    # Task links are not changed by updates, so links loaded for the conflict check
+    # are reused for the response instead of being queried again.
+    links_by_approval: dict[UUID, list[tuple[UUID, str | None]]] | None = None
     if "status" in updates:
         target_status = updates["status"]
         if target_status == "pending" and prior_status != "pending":
-            task_ids_by_approval = await load_task_ids_by_approval(
-                session, approval_ids=[approval.id]
+            links_by_approval = await load_task_links_by_approval(
+                session,
+                approval_ids=[approval.id],
             )
-            approval_task_ids = task_ids_by_approval.get(approval.id)
-            if not approval_task_ids and approval.task_id is not None:
-                approval_task_ids = [approval.task_id]
             await _ensure_no_pending_approval_conflicts(
                 session,
                 board_id=board.id,
-                task_ids=approval_task_ids or [],
+                task_ids=[task_id for task_id, _title in links_by_approval[approval.id]],
                 exclude_approval_id=approval.id,
             )
         approval.status = target_status
@@ -466,20 +770,14 @@ async def update_approval(
             approval.resolved_at = utcnow()
     session.add(approval)
     await session.commit()
+    if (prior_status == "pending") != (approval.status == "pending"):
+        _invalidate_pending_count(board.id)
     await session.refresh(approval)
     if approval.status in {"approved", "rejected"} and approval.status != prior_status:
-        try:
-            await _notify_lead_on_approval_resolution(
-                session=session,
-                board=board,
-                approval=approval,
-            )
-        except Exception:
-            logger.exception(
-                "approval.lead_notify_unexpected board_id=%s approval_id=%s status=%s",
-                board.id,
-                approval.id,
-                approval.status,
-            )
-    reads = await _approval_reads(session, [approval])
+        # The gateway hop should not hold the PATCH response or its DB connection.
+        spawn_background(
+            _notify_lead_in_background(board=board, approval_id=approval.id),
+            name=f"approval.lead_notify approval_id={approval.id}",
+        )
+    reads = await _approval_reads(session, [approval], links_by_approval=links_by_approval)
     return reads[0]
@@ -3,14 +3,18 @@
 from __future__ import annotations
 
 import asyncio
-import json
+from contextlib import suppress
+from dataclasses import dataclass
 from datetime import UTC, datetime
 from typing import TYPE_CHECKING
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, Query, Request
-from sqlalchemy import func
+import orjson
+from fastapi import APIRouter, Depends, Header, Query, Request
+from fastapi.responses import ORJSONResponse
+from sqlalchemy import func, literal, or_, tuple_
 from sqlmodel import col
+from sse_starlette.event import ServerSentEvent
 from sse_starlette.sse import EventSourceResponse
 
 from app.api.deps import (
@@ -19,31 +23,39 @@ from app.api.deps import (
     get_board_for_actor_write,
     require_admin_or_agent,
 )
+from app.core.background import spawn_background
 from app.core.config import settings
+from app.core.logging import get_logger
 from app.core.time import utcnow
-from app.db.pagination import paginate
+from app.db.notifications import BOARD_MEMORY_CHANNEL, notification_listener
+from app.db.pagination import KeysetParams, keyset_paginate, keyset_params
 from app.db.session import async_session_maker, get_session
 from app.models.agents import Agent
 from app.models.board_memory import BoardMemory
 from app.schemas.board_memory import BoardMemoryCreate, BoardMemoryRead
-from app.schemas.pagination import DefaultLimitOffsetPage
+from app.schemas.pagination import DefaultKeysetPage
 from app.services.mentions import extract_mentions, matches_agent_mention
 from app.services.openclaw.gateway_dispatch import GatewayDispatchService
 from app.services.openclaw.gateway_rpc import GatewayConfig as GatewayClientConfig
 
 if TYPE_CHECKING:
-    from collections.abc import AsyncIterator
+    from collections.abc import AsyncIterator, Sequence
 
-    from fastapi_pagination.limit_offset import LimitOffsetPage
     from sqlmodel.ext.asyncio.session import AsyncSession
 
+    from app.db.queryset import QuerySet
     from app.models.boards import Board
 
 router = APIRouter(prefix="/boards/{board_id}/memory", tags=["board-memory"])
+logger = get_logger(__name__)
 MAX_SNIPPET_LENGTH = 800
 STREAM_POLL_SECONDS = 2
+SUBSCRIBER_QUEUE_MAXSIZE = 256
+REPLAY_BATCH_SIZE = 64
 IS_CHAT_QUERY = Query(default=None)
 SINCE_QUERY = Query(default=None)
+LAST_EVENT_ID_HEADER = Header(default=None, alias="Last-Event-ID")
+KEYSET_PARAMS_DEP = Depends(keyset_params)
 BOARD_READ_DEP = Depends(get_board_for_actor_read)
 BOARD_WRITE_DEP = Depends(get_board_for_actor_write)
 SESSION_DEP = Depends(get_session)
@@ -67,33 +79,314 @@ def _parse_since(value: str | None) -> datetime | None:
     return parsed
 
 
-def _serialize_memory(memory: BoardMemory) -> dict[str, object]:
-    return BoardMemoryRead.model_validate(
-        memory,
-        from_attributes=True,
-    ).model_dump(mode="json")
+_MEMORY_READ_FIELDS = tuple(BoardMemoryRead.model_fields)
+
+
+def _memory_read(memory: BoardMemory) -> BoardMemoryRead:
+    # Rows loaded from the table already carry the schema's types; skip validation.
+    return BoardMemoryRead.model_construct(
+        **{field: getattr(memory, field) for field in _MEMORY_READ_FIELDS},
+    )
+
+
+def _serialize_memory(memory: BoardMemory) -> str:
+    """Encode the `{"memory": ...}` stream payload in one pass.
+
+    orjson writes UUIDs and naive datetimes exactly as `model_dump(mode="json")`
+    would, so python-mode dumping skips the intermediate string conversion.
+    """
+    return orjson.dumps({"memory": _memory_read(memory).model_dump(mode="python")}).decode()
+
+
+def _readable_memory(board_id: UUID) -> QuerySet[BoardMemory]:
+    # Blank content is rejected by `ck_board_memory_content_nonblank`, so every
+    # row is readable and these scans need no per-row predicate.
+    return BoardMemory.objects.filter_by(board_id=board_id)
 
 
 async def _fetch_memory_events(
     session: AsyncSession,
     board_id: UUID,
     since: datetime,
-    is_chat: bool | None = None,
 ) -> list[BoardMemory]:
     statement = (
-        BoardMemory.objects.filter_by(board_id=board_id)
-        # Old/invalid rows (empty/whitespace-only content) can exist; exclude them to
-        # satisfy the NonEmptyStr response schema.
-        .filter(func.length(func.trim(col(BoardMemory.content))) > 0)
+        _readable_memory(board_id)
+        .filter(col(BoardMemory.created_at) >= since)
+        .order_by(col(BoardMemory.created_at))
     )
+    return await statement.all(session)
+
+
+async def _iter_replay_events(
+    board_id: UUID,
+    since: datetime,
+    until: datetime,
+    is_chat: bool | None = None,
+) -> AsyncIterator[BoardMemory]:
+    """Yield rows created in `[since, until]` oldest-first, REPLAY_BATCH_SIZE at a time.
+
+    Each batch runs on its own short session, so a reconnecting client that replays
+    a long gap holds neither the whole gap in memory nor a pooled connection while
+    it drains.
+    """
+    created_at, row_id = col(BoardMemory.created_at), col(BoardMemory.id)
+    statement = _readable_memory(board_id).filter(created_at >= since, created_at <= until)
     if is_chat is not None:
         statement = statement.filter(col(BoardMemory.is_chat) == is_chat)
-    statement = statement.filter(col(BoardMemory.created_at) >= since).order_by(
-        col(BoardMemory.created_at),
+    statement = statement.order_by(created_at, row_id).limit(REPLAY_BATCH_SIZE)
+    batch_statement = statement
+    while True:
+        async with async_session_maker() as session:
+            batch = await batch_statement.all(session)
+        for memory in batch:
+            yield memory
+        if len(batch) < REPLAY_BATCH_SIZE:
+            return
+        last = batch[-1]
+        batch_statement = statement.filter(
+            tuple_(created_at, row_id) > tuple_(literal(last.created_at), literal(last.id)),
+        )
+
+
+async def _fetch_memory_by_ids(
+    session: AsyncSession,
+    board_id: UUID,
+    memory_ids: set[UUID],
+) -> list[BoardMemory]:
+    statement = (
+        _readable_memory(board_id)
+        .filter(col(BoardMemory.id).in_(memory_ids))
+        .order_by(col(BoardMemory.created_at))
     )
     return await statement.all(session)
 
 
+async def _replay_cursor(
+    session: AsyncSession,
+    board_id: UUID,
+    last_event_id: str,
+) -> BoardMemory | None:
+    """Return the last memory row a reconnecting client saw, if it is on this board."""
+    try:
+        memory_id = UUID(last_event_id.strip())
+    except ValueError:
+        return None
+    return await BoardMemory.objects.filter_by(id=memory_id, board_id=board_id).first(session)
+
+
+@dataclass(frozen=True, slots=True)
+class _MemoryStreamItem:
+    memory_id: UUID
+    created_at: datetime
+    # The complete SSE frame; EventSourceResponse writes bytes through unchanged.
+    frame: bytes
+
+
+def _memory_stream_item(memory: BoardMemory) -> _MemoryStreamItem:
+    # Encoded once per row and shared by every subscriber queue it is fanned out to.
+    event = ServerSentEvent(
+        id=str(memory.id),
+        event="memory",
+        data=_serialize_memory(memory),
+    )
+    return _MemoryStreamItem(
+        memory_id=memory.id,
+        created_at=memory.created_at,
+        frame=event.encode(),
+    )
+
+
+def _overflow_event(last_item: _MemoryStreamItem | None, since: datetime) -> dict[str, str]:
+    payload = {
+        "last_id": str(last_item.memory_id) if last_item else None,
+        "last_seen": (last_item.created_at if last_item else since).isoformat(),
+    }
+    return {"event": "overflow", "data": orjson.dumps(payload).decode()}
+
+
+# `None` is queued to a subscriber that fell SUBSCRIBER_QUEUE_MAXSIZE events behind.
+StreamQueue = asyncio.Queue[_MemoryStreamItem | None]
+
+
+class _BoardMemoryBroadcaster:
+    """Single fetch loop per board that fans new memory rows out to every subscriber.
+
+    While the NOTIFY listener is connected the loop sleeps until the insert trigger
+    reports new row ids and fetches only those; otherwise it falls back to polling.
+    """
+
+    def __init__(self, board_id: UUID) -> None:
+        self.board_id = board_id
+        self.last_seen = utcnow()
+        # Rows already published at `last_seen`; range queries are inclusive of it.
+        self.boundary_ids: set[UUID] = set()
+        self.pending_ids: set[UUID] = set()
+        self.resync = False
+        # Each subscriber queue maps to its `is_chat` filter.
+        self.subscribers: dict[StreamQueue, bool | None] = {}
+        self.task: asyncio.Task[None] | None = None
+        self.wakeup = asyncio.Event()
+        # Subscribers disconnected because they fell SUBSCRIBER_QUEUE_MAXSIZE behind.
+        self.overflowed_subscribers = 0
+
+    async def _wait_for_change(self) -> None:
+        push = notification_listener.connected and not self.resync
+        with suppress(TimeoutError):
+            await asyncio.wait_for(
+                self.wakeup.wait(),
+                timeout=None if push else STREAM_POLL_SECONDS,
+            )
+
+    async def _fetch(self) -> list[BoardMemory]:
+        pending_ids, self.pending_ids = self.pending_ids, set()
+        resync, self.resync = self.resync, False
+        poll = resync or not notification_listener.connected
+        if not poll and not pending_ids:
+            return []
+        try:
+            async with async_session_maker() as session:
+                if poll:
+                    return await _fetch_memory_events(session, self.board_id, self.last_seen)
+                return await _fetch_memory_by_ids(session, self.board_id, pending_ids)
+        except Exception:
+            logger.exception("board_memory.stream.fetch_failed board_id=%s", self.board_id)
+            # The notified ids are gone; catch up with a range query on the next pass.
+            self.resync = True
+            return []
+
+    async def run(self) -> None:
+        while self.subscribers:
+            # Cleared before fetching so a row committed mid-fetch triggers another pass.
+            self.wakeup.clear()
+            self._publish(await self._fetch())
+            await self._wait_for_change()
+
+    def _publish(self, memories: list[BoardMemory]) -> None:
+        overflowed: set[StreamQueue] = set()
+        for memory in memories:
+            if memory.id in self.boundary_ids:
+                continue
+            if memory.created_at > self.last_seen:
+                self.last_seen = memory.created_at
+                self.boundary_ids = set()
+            if memory.created_at == self.last_seen:
+                self.boundary_ids.add(memory.id)
+            item = _memory_stream_item(memory)
+            for queue, is_chat in self.subscribers.items():
+                if queue in overflowed or (is_chat is not None and memory.is_chat != is_chat):
+                    continue
+                if queue.full():
+                    # Slow consumers are cut loose rather than buffered without bound;
+                    # they reconnect from their own cursor and replay the gap.
+                    while not queue.empty():
+                        queue.get_nowait()
+                    queue.put_nowait(None)
+                    overflowed.add(queue)
+                    continue
+                queue.put_nowait(item)
+        if overflowed:
+            for queue in overflowed:
+                del self.subscribers[queue]
+            self.overflowed_subscribers += len(overflowed)
+            logger.warning(
+                "board_memory.stream.subscriber_overflow board_id=%s disconnected=%s "
+                "disconnected_total=%s",
+                self.board_id,
+                len(overflowed),
+                self.overflowed_subscribers,
+            )
+
+
+_board_broadcasters: dict[UUID, _BoardMemoryBroadcaster] = {}
+
+
+def _on_board_memory_notification(payload: str | None) -> None:
+    if payload is None:
+        for broadcaster in _board_broadcasters.values():
+            broadcaster.resync = True
+            broadcaster.wakeup.set()
+        return
+    board_id, _, memory_id = payload.partition(":")
+    try:
+        board_uuid, memory_uuid = UUID(board_id), UUID(memory_id)
+    except ValueError:
+        logger.warning("board_memory.stream.bad_notification payload=%s", payload)
+        return
+    board_broadcaster = _board_broadcasters.get(board_uuid)
+    if board_broadcaster is not None:
+        board_broadcaster.pending_ids.add(memory_uuid)
+        board_broadcaster.wakeup.set()
+
+
+def _subscribe_board_memory_stream(
+    board_id: UUID,
+    *,
+    is_chat: bool | None,
+) -> tuple[_BoardMemoryBroadcaster, StreamQueue]:
+    broadcaster = _board_broadcasters.get(board_id)
+    if broadcaster is None:
+        broadcaster = _BoardMemoryBroadcaster(board_id)
+        _board_broadcasters[board_id] = broadcaster
+    notification_listener.add_handler(BOARD_MEMORY_CHANNEL, _on_board_memory_notification)
+    queue: StreamQueue = asyncio.Queue(maxsize=SUBSCRIBER_QUEUE_MAXSIZE)
+    broadcaster.subscribers[queue] = is_chat
+    if broadcaster.task is None or broadcaster.task.done():
+        broadcaster.task = asyncio.create_task(broadcaster.run())
+    return broadcaster, queue
+
+
+def _unsubscribe_board_memory_stream(
+    broadcaster: _BoardMemoryBroadcaster,
+    queue: StreamQueue,
+) -> None:
+    broadcaster.subscribers.pop(queue, None)
+    if broadcaster.subscribers:
+        return
+    if broadcaster.task is not None:
+        broadcaster.task.cancel()
+    if _board_broadcasters.get(broadcaster.board_id) is broadcaster:
+        del _board_broadcasters[broadcaster.board_id]
+
+
+async def _send_to_agents(
+    *,
+    dispatch: GatewayDispatchService,
+    config: GatewayClientConfig,
+    board: Board,
+    messages: list[tuple[Agent, str]],
+    deliver: bool = False,
+) -> None:
+    """Send each agent its message concurrently and log failed deliveries."""
+    sends = [
+        (agent, message, agent.openclaw_session_id)
+        for agent, message in messages
+        if agent.openclaw_session_id
+    ]
+    errors = await asyncio.gather(
+        *(
+            dispatch.try_send_agent_message(
+                session_key=session_key,
+                config=config,
+                agent_name=agent.name,
+                message=message,
+                deliver=deliver,
+            )
+            for agent, message, session_key in sends
+        ),
+        # Only gateway errors come back as values; anything raised must not abort the
+        # sibling sends or go unlogged.
+        return_exceptions=True,
+    )
+    for (agent, _message, _session_key), error in zip(sends, errors, strict=True):
+        if error is not None:
+            logger.warning(
+                "board_memory.notify_failed board_id=%s agent_id=%s error=%s",
+                board.id,
+                agent.id,
+                error,
+            )
+
+
 async def _send_control_command(
     *,
     session: AsyncSession,
@@ -108,20 +401,42 @@ async def _send_control_command(
     ).all(
         session,
     )
-    for agent in pause_targets:
-        if actor.actor_type == "agent" and actor.agent and agent.id == actor.agent.id:
-            continue
-        if not agent.openclaw_session_id:
-            continue
-        error = await dispatch.try_send_agent_message(
-            session_key=agent.openclaw_session_id,
-            config=config,
-            agent_name=agent.name,
-            message=command,
-            deliver=True,
+    await _send_to_agents(
+        dispatch=dispatch,
+        config=config,
+        board=board,
+        messages=[
+            (agent, command)
+            for agent in pause_targets
+            if not (actor.actor_type == "agent" and actor.agent and agent.id == actor.agent.id)
+        ],
+        deliver=True,
+    )
+
+
+async def _chat_target_candidates(
+    session: AsyncSession,
+    *,
+    board_id: UUID,
+    mentions: set[str],
+) -> list[Agent]:
+    """Load only agents that could receive the message: the lead and name matches.
+
+    The name test is a superset of `matches_agent_mention` (full name or first
+    word) so `_chat_targets` still makes the exact decision.
+    """
+    name = func.lower(col(Agent.name))
+    return await (
+        Agent.objects.filter_by(board_id=board_id)
+        .filter(col(Agent.openclaw_session_id).is_not(None))
+        .filter(
+            or_(
+                col(Agent.is_board_lead).is_(True),
+                *(name.contains(mention) for mention in mentions - {"lead"}),
+            ),
         )
-        if error is not None:
-            continue
+        .all(session)
+    )
 
 
 def _chat_targets(
@@ -181,7 +496,7 @@ async def _notify_chat_targets(
 
     mentions = extract_mentions(memory.content)
     targets = _chat_targets(
-        agents=await Agent.objects.filter_by(board_id=board.id).all(session),
+        agents=await _chat_target_candidates(session, board_id=board.id, mentions=mentions),
         mentions=mentions,
         actor=actor,
     )
@@ -192,49 +507,61 @@ async def _notify_chat_targets(
     if len(snippet) > MAX_SNIPPET_LENGTH:
         snippet = f"{snippet[: MAX_SNIPPET_LENGTH - 3]}..."
     base_url = settings.base_url or "http://localhost:8000"
-    for agent in targets.values():
-        if not agent.openclaw_session_id:
-            continue
-        mentioned = matches_agent_mention(agent, mentions)
-        header = "BOARD CHAT MENTION" if mentioned else "BOARD CHAT"
-        message = (
-            f"{header}\n"
-            f"Board: {board.name}\n"
-            f"From: {actor_name}\n\n"
-            f"{snippet}\n\n"
-            "Reply via board chat:\n"
-            f"POST {base_url}/api/v1/agent/boards/{board.id}/memory\n"
-            'Body: {"content":"...","tags":["chat"]}'
-        )
-        error = await dispatch.try_send_agent_message(
-            session_key=agent.openclaw_session_id,
-            config=config,
-            agent_name=agent.name,
-            message=message,
-        )
-        if error is not None:
-            continue
+    # Only the header differs between recipients; render the body once.
+    body = (
+        f"Board: {board.name}\n"
+        f"From: {actor_name}\n\n"
+        f"{snippet}\n\n"
+        "Reply via board chat:\n"
+        f"POST {base_url}/api/v1/agent/boards/{board.id}/memory\n"
+        'Body: {"content":"...","tags":["chat"]}'
+    )
+    mention_message = f"BOARD CHAT MENTION\n{body}"
+    plain_message = f"BOARD CHAT\n{body}"
+    messages = [
+        (agent, mention_message if matches_agent_mention(agent, mentions) else plain_message)
+        for agent in targets.values()
+    ]
+    await _send_to_agents(dispatch=dispatch, config=config, board=board, messages=messages)
 
 
-@router.get("", response_model=DefaultLimitOffsetPage[BoardMemoryRead])
+async def _notify_chat_targets_in_background(
+    *,
+    board: Board,
+    memory: BoardMemory,
+    actor: ActorContext,
+) -> None:
+    async with async_session_maker() as session:
+        await _notify_chat_targets(session=session, board=board, memory=memory, actor=actor)
+
+
+@router.get("", response_model=DefaultKeysetPage[BoardMemoryRead])
 async def list_board_memory(
     *,
     is_chat: bool | None = IS_CHAT_QUERY,
     board: Board = BOARD_READ_DEP,
     session: AsyncSession = SESSION_DEP,
     _actor: ActorContext = ACTOR_DEP,
-) -> LimitOffsetPage[BoardMemoryRead]:
-    """List board memory entries, optionally filtering chat entries."""
-    statement = (
-        BoardMemory.objects.filter_by(board_id=board.id)
-        # Old/invalid rows (empty/whitespace-only content) can exist; exclude them to
-        # satisfy the NonEmptyStr response schema.
-        .filter(func.length(func.trim(col(BoardMemory.content))) > 0)
-    )
+    params: KeysetParams = KEYSET_PARAMS_DEP,
+) -> ORJSONResponse:
+    """List board memory entries newest-first, optionally filtering chat entries."""
+    statement = _readable_memory(board.id)
     if is_chat is not None:
         statement = statement.filter(col(BoardMemory.is_chat) == is_chat)
-    statement = statement.order_by(col(BoardMemory.created_at).desc())
-    return await paginate(session, statement.statement)
+
+    def _transform(items: Sequence[BoardMemory]) -> list[dict[str, object]]:
+        return [_memory_read(memory).model_dump(mode="python") for memory in items]
+
+    page: DefaultKeysetPage[dict[str, object]] = await keyset_paginate(
+        session,
+        statement.statement,
+        model=BoardMemory,
+        params=params,
+        transformer=_transform,
+    )
+    # `response_model` still documents the page; returning a response directly
+    # skips FastAPI's jsonable_encoder pass and response re-validation.
+    return ORJSONResponse(page.model_dump(mode="python"))
 
 
 @router.get("/stream")
@@ -245,28 +572,55 @@ async def stream_board_memory(
     _actor: ActorContext = ACTOR_DEP,
     since: str | None = SINCE_QUERY,
     is_chat: bool | None = IS_CHAT_QUERY,
+    last_event_id: str | None = LAST_EVENT_ID_HEADER,
 ) -> EventSourceResponse:
-    """Stream board memory events over server-sent events."""
-    since_dt = _parse_since(since) or utcnow()
-    last_seen = since_dt
-
-    async def event_generator() -> AsyncIterator[dict[str, str]]:
-        nonlocal last_seen
-        while True:
-            if await request.is_disconnected():
-                break
-            async with async_session_maker() as session:
-                memories = await _fetch_memory_events(
-                    session,
+    """Stream board memory events over server-sent events.
+
+    Reconnecting clients resume after the `Last-Event-ID` row when it is known,
+    otherwise from `since`.
+    """
+    since_dt = _parse_since(since)
+
+    async def event_generator() -> AsyncIterator[bytes | dict[str, str]]:
+        broadcaster, queue = _subscribe_board_memory_stream(board.id, is_chat=is_chat)
+        # Rows up to this cursor were published before the queue existed.
+        joined_at, published = broadcaster.last_seen, set(broadcaster.boundary_ids)
+        replay_since, skip_id = since_dt, None
+        last_item: _MemoryStreamItem | None = None
+        try:
+            if last_event_id:
+                async with async_session_maker() as session:
+                    cursor = await _replay_cursor(session, board.id, last_event_id)
+                if cursor is not None:
+                    replay_since, skip_id = cursor.created_at, cursor.id
+            if replay_since is not None and replay_since <= joined_at:
+                # Replay the gap between the client's cursor and the broadcaster; later
+                # rows arrive through the queue.
+                async for memory in _iter_replay_events(
                     board.id,
-                    last_seen,
+                    replay_since,
+                    joined_at,
                     is_chat=is_chat,
-                )
-            for memory in memories:
-                last_seen = max(memory.created_at, last_seen)
-                payload = {"memory": _serialize_memory(memory)}
-                yield {"event": "memory", "data": json.dumps(payload)}
-            await asyncio.sleep(STREAM_POLL_SECONDS)
+                ):
+                    if memory.id == skip_id:
+                        continue
+                    if memory.created_at < joined_at or memory.id in published:
+                        last_item = _memory_stream_item(memory)
+                        yield last_item.frame
+            while True:
+                if await request.is_disconnected():
+                    break
+                try:
+                    item = await asyncio.wait_for(queue.get(), timeout=STREAM_POLL_SECONDS)
+                except TimeoutError:
+                    continue
+                if item is None:
+                    yield _overflow_event(last_item, replay_since or joined_at)
+                    break
+                last_item = item
+                yield item.frame
+        finally:
+            _unsubscribe_board_memory_stream(broadcaster, queue)
 
     return EventSourceResponse(event_generator(), ping=15)
 
@@ -277,7 +631,7 @@ async def create_board_memory(
     board: Board = BOARD_WRITE_DEP,
     session: AsyncSession = SESSION_DEP,
     actor: ActorContext = ACTOR_DEP,
-) -> BoardMemory:
+) -> ORJSONResponse:
     """Create a board memory entry and notify chat targets when needed."""
     is_chat = payload.tags is not None and "chat" in payload.tags
     source = payload.source
@@ -297,10 +651,10 @@ async def create_board_memory(
     await session.commit()
     await session.refresh(memory)
     if is_chat:
-        await _notify_chat_targets(
-            session=session,
-            board=board,
-            memory=memory,
-            actor=actor,
+        # Gateway round trips run after the response on their own session.
+        spawn_background(
+            _notify_chat_targets_in_background(board=board, memory=memory, actor=actor),
+            name=f"board_memory.notify memory_id={memory.id}",
         )
-    return memory
+    # Returned as a prebuilt response so the just-refreshed row is not re-validated.
+    return ORJSONResponse(_memory_read(memory).model_dump(mode="python"))
@@ -183,6 +183,7 @@ async def get_onboarding(
     onboarding = (
         await BoardOnboardingSession.objects.filter_by(board_id=board.id)
         .order_by(col(BoardOnboardingSession.updated_at).desc())
+        .limit(1)
         .first(session)
     )
     if onboarding is None:
@@ -200,6 +201,7 @@ async def start_onboarding(
     onboarding = (
         await BoardOnboardingSession.objects.filter_by(board_id=board.id)
         .filter(col(BoardOnboardingSession.status) == "active")
+        .limit(1)
         .first(session)
     )
     if onboarding:
@@ -326,6 +328,7 @@ async def answer_onboarding(
     onboarding = (
         await BoardOnboardingSession.objects.filter_by(board_id=board.id)
         .order_by(col(BoardOnboardingSession.updated_at).desc())
+        .limit(1)
         .first(session)
     )
     if onboarding is None:
@@ -336,9 +339,10 @@ async def answer_onboarding(
     if payload.other_text:
         answer_text = f"{payload.answer}: {payload.other_text}"
 
+    now = utcnow()
     messages = list(onboarding.messages or [])
     messages.append(
-        {"role": "user", "content": answer_text, "timestamp": utcnow().isoformat()},
+        {"role": "user", "content": answer_text, "timestamp": now.isoformat()},
     )
 
     await dispatcher.dispatch_answer(
@@ -349,7 +353,7 @@ async def answer_onboarding(
     )
 
     onboarding.messages = messages
-    onboarding.updated_at = utcnow()
+    onboarding.updated_at = now
     session.add(onboarding)
     await session.commit()
     await session.refresh(onboarding)
@@ -379,6 +383,7 @@ async def agent_onboarding_update(
     onboarding = (
         await BoardOnboardingSession.objects.filter_by(board_id=board.id)
         .order_by(col(BoardOnboardingSession.updated_at).desc())
+        .limit(1)
         .first(session)
     )
     if onboarding is None:
@@ -387,7 +392,7 @@ async def agent_onboarding_update(
         raise HTTPException(status_code=status.HTTP_409_CONFLICT)
 
     messages = list(onboarding.messages or [])
-    now = utcnow().isoformat()
+    now = utcnow()
     payload_text = payload.model_dump_json(exclude_none=True)
     payload_data = payload.model_dump(mode="json", exclude_none=True)
     logger.info(
@@ -400,15 +405,15 @@ async def agent_onboarding_update(
         onboarding.draft_goal = payload_data
         onboarding.status = "completed"
         messages.append(
-            {"role": "assistant", "content": payload_text, "timestamp": now},
+            {"role": "assistant", "content": payload_text, "timestamp": now.isoformat()},
         )
     else:
         messages.append(
-            {"role": "assistant", "content": payload_text, "timestamp": now},
+            {"role": "assistant", "content": payload_text, "timestamp": now.isoformat()},
         )
 
     onboarding.messages = messages
-    onboarding.updated_at = utcnow()
+    onboarding.updated_at = now
     session.add(onboarding)
     await session.commit()
     await session.refresh(onboarding)
@@ -432,6 +437,7 @@ async def confirm_onboarding(
     onboarding = (
         await BoardOnboardingSession.objects.filter_by(board_id=board.id)
         .order_by(col(BoardOnboardingSession.updated_at).desc())
+        .limit(1)
         .first(session)
     )
     if onboarding is None:
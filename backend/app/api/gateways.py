@@ -8,6 +8,7 @@ from uuid import UUID, uuid4
 from fastapi import APIRouter, Depends, Query
 from sqlmodel import col
 
+from app.api import approvals as approvals_api
 from app.api.deps import require_org_admin
 from app.core.auth import AuthContext, get_auth_context
 from app.db import crud
@@ -141,6 +142,7 @@ async def update_gateway(
         if next_url:
             await service.assert_gateway_runtime_compatible(url=next_url, token=next_token)
     await crud.patch(session, gateway, updates)
+    approvals_api.invalidate_gateway_configs(gateway.id)
     await service.ensure_main_agent(gateway, auth, action="update")
     return gateway
 
@@ -200,4 +202,5 @@ async def delete_gateway(
 
     await session.delete(gateway)
     await session.commit()
+    approvals_api.invalidate_gateway_configs(gateway.id)
     return OkResponse()
@@ -4,6 +4,8 @@ This module is used for *agent-originated* API calls (as opposed to human users)
 
 Key ideas:
 - Agents authenticate with an opaque token presented as `X-Agent-Token: <token>`.
+- Tokens embed a public lookup id (`v1.<token_id>.<secret>`) so each request
+  verifies a single stored hash; legacy id-less tokens fall back to a scan.
 - For convenience, some deployments may also allow `Authorization: Bearer <token>`
   for agents (controlled by caller/dependency).
 - To reduce write-amplification, we only touch `Agent.last_seen_at` at a fixed
@@ -15,14 +17,17 @@ so we can evolve agent policy independently.
 
 from __future__ import annotations
 
+import hashlib
+import time
 from dataclasses import dataclass
 from datetime import timedelta
 from typing import TYPE_CHECKING, Literal
+from uuid import UUID
 
 from fastapi import Depends, Header, HTTPException, Request, status
 from sqlmodel import col, select
 
-from app.core.agent_tokens import verify_agent_token
+from app.core.agent_tokens import agent_token_id, verify_agent_token
 from app.core.logging import get_logger
 from app.core.time import utcnow
 from app.db.session import get_session
@@ -36,6 +41,11 @@ logger = get_logger(__name__)
 _LAST_SEEN_TOUCH_INTERVAL = timedelta(seconds=30)
 _SAFE_METHODS = frozenset({"GET", "HEAD", "OPTIONS"})
 SESSION_DEP = Depends(get_session)
+_TOKEN_CACHE_TTL_SECONDS = 60.0
+_TOKEN_CACHE_MAXSIZE = 4096
+# sha256(token) -> (agent id, token hash it verified against, expiry). Keyed by
+# digest so raw tokens are never held; the TTL bounds revocation lag.
+_verified_tokens: dict[bytes, tuple[UUID, str, float]] = {}
 
 
 @dataclass
@@ -47,9 +57,45 @@ class AgentAuthContext:
 
 
 async def _find_agent_for_token(session: AsyncSession, token: str) -> Agent | None:
+    key = hashlib.sha256(token.encode("utf-8")).digest()
+    cached = _verified_tokens.get(key)
+    if cached is not None:
+        agent_id, token_hash, expires_at = cached
+        if expires_at > time.monotonic():
+            agent = await session.get(Agent, agent_id)
+            # Rotating or revoking the token replaces the stored hash.
+            if agent is not None and agent.agent_token_hash == token_hash:
+                return agent
+        _verified_tokens.pop(key, None)
+    agent = await _verify_agent_for_token(session, token)
+    if agent is not None and agent.agent_token_hash:
+        if len(_verified_tokens) >= _TOKEN_CACHE_MAXSIZE:
+            _verified_tokens.pop(next(iter(_verified_tokens)))
+        _verified_tokens[key] = (
+            agent.id,
+            agent.agent_token_hash,
+            time.monotonic() + _TOKEN_CACHE_TTL_SECONDS,
+        )
+    return agent
+
+
+async def _verify_agent_for_token(session: AsyncSession, token: str) -> Agent | None:
+    token_id = agent_token_id(token)
+    if token_id is not None:
+        # One indexed fetch and a single PBKDF2 verify, however many agents exist.
+        agent = (
+            await session.exec(select(Agent).where(col(Agent.agent_token_id) == token_id))
+        ).first()
+        if agent is None or not agent.agent_token_hash:
+            return None
+        return agent if verify_agent_token(token, agent.agent_token_hash) else None
+    # Tokens minted before token ids existed can only be matched by scanning, so
+    # limit the scan to agents that still hold one; rotation moves them off it.
     agents = list(
         await session.exec(
-            select(Agent).where(col(Agent.agent_token_hash).is_not(None)),
+            select(Agent)
+            .where(col(Agent.agent_token_hash).is_not(None))
+            .where(col(Agent.agent_token_id).is_(None)),
         ),
     )
     for agent in agents:
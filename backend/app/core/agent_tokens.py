@@ -9,11 +9,29 @@ import secrets
 
 ITERATIONS = 200_000
 SALT_BYTES = 16
+TOKEN_VERSION = "v1"
+TOKEN_ID_BYTES = 16
 
 
 def generate_agent_token() -> str:
-    """Generate a new URL-safe random token for an agent."""
-    return secrets.token_urlsafe(32)
+    """Generate a new `v1.<token_id>.<secret>` token for an agent.
+
+    The token id is not secret; it lets auth fetch the one candidate agent
+    instead of verifying the token against every stored hash.
+    """
+    token_id = secrets.token_urlsafe(TOKEN_ID_BYTES)
+    return f"{TOKEN_VERSION}.{token_id}.{secrets.token_urlsafe(32)}"
+
+
+def agent_token_id(token: str) -> str | None:
+    """Return the lookup id embedded in a `v1.` token, or `None` for legacy tokens."""
+    parts = token.split(".")
+    if len(parts) != 3:
+        return None
+    version, token_id, secret = parts
+    if version != TOKEN_VERSION or not token_id or not secret:
+        return None
+    return token_id
 
 
 def _b64encode(value: bytes) -> str:
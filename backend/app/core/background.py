@@ -0,0 +1,43 @@
+"""Fire-and-forget task helpers for work that should not hold a request open."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Coroutine
+from typing import Any
+
+from app.core.logging import get_logger
+
+logger = get_logger(__name__)
+
+# The event loop only keeps weak references to tasks; hold them until they finish.
+_tasks: set[asyncio.Task[None]] = set()
+
+
+def _on_task_done(task: asyncio.Task[None]) -> None:
+    _tasks.discard(task)
+    if task.cancelled():
+        return
+    exc = task.exception()
+    if exc is not None:
+        logger.error("background.task_failed name=%s", task.get_name(), exc_info=exc)
+
+
+def spawn_background(coro: Coroutine[Any, Any, None], *, name: str) -> asyncio.Task[None]:
+    """Schedule `coro` without awaiting it; failures are logged under `name`."""
+    task = asyncio.create_task(coro, name=name)
+    _tasks.add(task)
+    task.add_done_callback(_on_task_done)
+    return task
+
+
+async def drain_background_tasks(timeout: float = 10.0) -> None:
+    """Wait up to `timeout` seconds for in-flight tasks, then cancel and await the rest."""
+    if not _tasks:
+        return
+    _done, pending = await asyncio.wait(set(_tasks), timeout=timeout)
+    for task in pending:
+        logger.warning("background.task_cancelled name=%s", task.get_name())
+        task.cancel()
+    # Let cancelled tasks run their cleanup before the event loop shuts down.
+    await asyncio.gather(*pending, return_exceptions=True)
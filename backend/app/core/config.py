@@ -52,6 +52,11 @@ class Settings(BaseSettings):
 
     # Database lifecycle
     db_auto_migrate: bool = False
+    # Postgres connection pool
+    db_pool_size: int = Field(default=20, ge=1)
+    db_max_overflow: int = Field(default=40, ge=0)
+    db_pool_timeout_seconds: float = Field(default=5.0, gt=0)
+    db_pool_recycle_seconds: int = Field(default=1800, ge=-1)
 
     # RQ queueing / dispatch
     rq_redis_url: str = "redis://localhost:6379/0"
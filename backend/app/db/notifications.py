@@ -0,0 +1,108 @@
+"""Postgres LISTEN/NOTIFY listener used to push change streams instead of polling."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Callable
+from contextlib import suppress
+
+import psycopg
+from psycopg import sql
+from sqlalchemy.engine import make_url
+
+from app.core.config import settings
+from app.core.logging import get_logger
+
+logger = get_logger(__name__)
+
+# Handlers receive the NOTIFY payload, or `None` when the listener (re)connects or
+# drops and notifications may have been missed, so subscribers should resync.
+NotificationHandler = Callable[[str | None], None]
+
+APPROVALS_CHANNEL = "approvals"
+BOARD_MEMORY_CHANNEL = "board_memory"
+RECONNECT_DELAY_SECONDS = 5.0
+# Upper bound on how long newly-registered channels wait for their LISTEN.
+_NOTIFY_WAIT_SECONDS = 1.0
+
+
+def listener_conninfo(database_url: str) -> str | None:
+    """Return a libpq conninfo for the listener, or `None` for non-Postgres databases."""
+    url = make_url(database_url)
+    if url.get_backend_name() != "postgresql":
+        return None
+    return url.set(drivername="postgresql").render_as_string(hide_password=False)
+
+
+class PgNotificationListener:
+    """Own one dedicated connection per process and dispatch NOTIFY payloads by channel."""
+
+    def __init__(self, conninfo: str | None) -> None:
+        self._conninfo = conninfo
+        self._handlers: dict[str, set[NotificationHandler]] = {}
+        self._task: asyncio.Task[None] | None = None
+        self.connected = False
+
+    def add_handler(self, channel: str, handler: NotificationHandler) -> None:
+        """Register a handler for a channel and start listening if needed."""
+        self._handlers.setdefault(channel, set()).add(handler)
+        if self._conninfo is not None and (self._task is None or self._task.done()):
+            self._task = asyncio.create_task(self._run(self._conninfo))
+
+    def remove_handler(self, channel: str, handler: NotificationHandler) -> None:
+        """Unregister a previously added handler."""
+        handlers = self._handlers.get(channel)
+        if handlers is None:
+            return
+        handlers.discard(handler)
+        if not handlers:
+            del self._handlers[channel]
+
+    async def close(self) -> None:
+        """Stop the listener task and release its connection."""
+        task, self._task = self._task, None
+        if task is None:
+            return
+        task.cancel()
+        with suppress(asyncio.CancelledError):
+            await task
+
+    def _dispatch(self, channel: str, payload: str | None) -> None:
+        for handler in list(self._handlers.get(channel, ())):
+            try:
+                handler(payload)
+            except Exception:
+                logger.exception("db.notifications.handler_failed channel=%s", channel)
+
+    def _dispatch_resync(self, channels: set[str]) -> None:
+        for channel in channels:
+            self._dispatch(channel, None)
+
+    async def _run(self, conninfo: str) -> None:
+        while True:
+            try:
+                await self._listen(conninfo)
+            except Exception:
+                logger.exception("db.notifications.listener_failed")
+            finally:
+                if self.connected:
+                    self.connected = False
+                    self._dispatch_resync(set(self._handlers))
+            await asyncio.sleep(RECONNECT_DELAY_SECONDS)
+
+    async def _listen(self, conninfo: str) -> None:
+        async with await psycopg.AsyncConnection.connect(conninfo, autocommit=True) as conn:
+            listening: set[str] = set()
+            while True:
+                pending = set(self._handlers) - listening
+                for channel in pending:
+                    await conn.execute(sql.SQL("LISTEN {}").format(sql.Identifier(channel)))
+                listening |= pending
+                self.connected = True
+                # Anything committed before LISTEN took effect was not delivered.
+                self._dispatch_resync(pending)
+                async for notify in conn.notifies(timeout=_NOTIFY_WAIT_SECONDS):
+                    self._dispatch(notify.channel, notify.payload)
+
+
+notification_listener = PgNotificationListener(listener_conninfo(settings.database_url))
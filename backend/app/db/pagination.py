@@ -2,12 +2,21 @@
 
 from __future__ import annotations
 
+import base64
+import binascii
+import inspect
 from collections.abc import Awaitable, Callable, Sequence
+from dataclasses import dataclass
+from datetime import datetime
 from typing import TYPE_CHECKING, Any, TypeVar
+from uuid import UUID
 
+from fastapi import HTTPException, Query, status
 from fastapi_pagination.ext.sqlalchemy import paginate as _paginate
+from sqlalchemy import literal, tuple_
+from sqlmodel import col
 
-from app.schemas.pagination import DefaultLimitOffsetPage
+from app.schemas.pagination import DefaultKeysetPage, DefaultLimitOffsetPage
 
 if TYPE_CHECKING:
     from fastapi_pagination.limit_offset import LimitOffsetPage
@@ -21,6 +30,10 @@ Transformer = Callable[
     Sequence[Any] | Awaitable[Sequence[Any]],
 ]
 
+KEYSET_LIMIT_QUERY = Query(200, ge=1, le=200)
+KEYSET_CURSOR_QUERY = Query(default=None)
+INVALID_CURSOR_DETAIL = "Invalid pagination cursor."
+
 
 async def paginate(
     session: AsyncSession,
@@ -31,3 +44,89 @@ async def paginate(
     """Execute a paginated query and cast to the project page type alias."""
     page = await _paginate(session, statement, transformer=transformer)
     return DefaultLimitOffsetPage[T].model_validate(page)
+
+
+def encode_keyset_cursor(created_at: datetime, row_id: UUID) -> str:
+    """Encode a `(created_at, id)` position as an opaque URL-safe cursor."""
+    raw = f"{created_at.isoformat()}|{row_id}".encode()
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def decode_keyset_cursor(cursor: str) -> tuple[datetime, UUID]:
+    """Decode a cursor produced by `encode_keyset_cursor` or raise `ValueError`."""
+    padding = "=" * (-len(cursor) % 4)
+    try:
+        raw = base64.urlsafe_b64decode(cursor + padding).decode()
+    except (binascii.Error, UnicodeDecodeError) as exc:
+        raise ValueError(INVALID_CURSOR_DETAIL) from exc
+    created_at_text, sep, row_id_text = raw.partition("|")
+    if not sep:
+        raise ValueError(INVALID_CURSOR_DETAIL)
+    return datetime.fromisoformat(created_at_text), UUID(row_id_text)
+
+
+@dataclass(frozen=True)
+class KeysetParams:
+    """Decoded keyset pagination parameters for newest-first list endpoints."""
+
+    limit: int = 200
+    after: tuple[datetime, UUID] | None = None
+
+
+def keyset_params(
+    limit: int = KEYSET_LIMIT_QUERY,
+    cursor: str | None = KEYSET_CURSOR_QUERY,
+) -> KeysetParams:
+    """Resolve `limit` / `cursor` query params, rejecting malformed cursors."""
+    if not cursor:
+        return KeysetParams(limit=limit)
+    try:
+        after = decode_keyset_cursor(cursor)
+    except ValueError as exc:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_CONTENT,
+            detail=INVALID_CURSOR_DETAIL,
+        ) from exc
+    return KeysetParams(limit=limit, after=after)
+
+
+async def keyset_paginate(
+    session: AsyncSession,
+    statement: SelectOfScalar[Any],
+    *,
+    model: type[Any],
+    params: KeysetParams,
+    transformer: Transformer | None = None,
+    created_at_field: str = "created_at",
+    id_field: str = "id",
+) -> DefaultKeysetPage[T]:
+    """Fetch one newest-first page by seeking past the cursor instead of OFFSET.
+
+    Rows are ordered by `(created_at, id)` descending so the page boundary is a
+    strict tuple comparison the database can answer straight from an index.
+    """
+    created_at_column = col(getattr(model, created_at_field))
+    id_column = col(getattr(model, id_field))
+    if params.after is not None:
+        after_created_at, after_id = params.after
+        statement = statement.where(
+            tuple_(created_at_column, id_column)
+            < tuple_(literal(after_created_at), literal(after_id)),
+        )
+    statement = statement.order_by(created_at_column.desc(), id_column.desc()).limit(
+        params.limit + 1,
+    )
+    rows: Sequence[Any] = list(await session.exec(statement))
+    next_cursor: str | None = None
+    if len(rows) > params.limit:
+        rows = rows[: params.limit]
+        last = rows[-1]
+        next_cursor = encode_keyset_cursor(
+            getattr(last, created_at_field),
+            getattr(last, id_field),
+        )
+    items: Sequence[Any] = rows
+    if transformer is not None:
+        transformed = transformer(rows)
+        items = await transformed if inspect.isawaitable(transformed) else transformed
+    return DefaultKeysetPage[T](items=list(items), limit=params.limit, next_cursor=next_cursor)
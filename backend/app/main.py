@@ -31,9 +31,11 @@ from app.api.tags import router as tags_router
 from app.api.task_custom_fields import router as task_custom_fields_router
 from app.api.tasks import router as tasks_router
 from app.api.users import router as users_router
+from app.core.background import drain_background_tasks
 from app.core.config import settings
 from app.core.error_handling import install_error_handling
 from app.core.logging import configure_logging, get_logger
+from app.db.notifications import notification_listener
 from app.db.session import init_db
 from app.schemas.health import HealthStatusResponse
 
@@ -440,6 +442,8 @@ async def lifespan(_: FastAPI) -> AsyncIterator[None]:
     try:
         yield
     finally:
+        await drain_background_tasks()
+        await notification_listener.close()
         logger.info("app.lifecycle.stopped")
 
 
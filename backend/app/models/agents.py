@@ -27,6 +27,8 @@ class Agent(QueryModel, table=True):
     status: str = Field(default="provisioning", index=True)
     openclaw_session_id: str | None = Field(default=None, index=True)
     agent_token_hash: str | None = Field(default=None, index=True)
+    # Public lookup id embedded in `v1.` tokens; `None` for legacy tokens.
+    agent_token_id: str | None = Field(default=None, max_length=22, unique=True, index=True)
     heartbeat_config: dict[str, Any] | None = Field(
         default=None,
         sa_column=Column(JSON),
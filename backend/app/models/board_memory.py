@@ -5,7 +5,7 @@ from __future__ import annotations
 from datetime import datetime
 from uuid import UUID, uuid4
 
-from sqlalchemy import JSON, Column
+from sqlalchemy import JSON, CheckConstraint, Column
 from sqlmodel import Field
 
 from app.core.time import utcnow
@@ -18,6 +18,12 @@ class BoardMemory(QueryModel, table=True):
     """Persisted memory item attached directly to a board."""
 
     __tablename__ = "board_memory"  # pyright: ignore[reportAssignmentType]
+    __table_args__ = (
+        CheckConstraint(
+            "length(trim(content)) > 0",
+            name="ck_board_memory_content_nonblank",
+        ),
+    )
 
     id: UUID = Field(default_factory=uuid4, primary_key=True)
     board_id: UUID = Field(foreign_key="boards.id", index=True)
@@ -95,3 +95,20 @@ class ApprovalRead(ApprovalBase):
     agent_id: UUID | None = None
     created_at: datetime
     resolved_at: datetime | None = None
+
+
+class ApprovalTaskCounts(SQLModel):
+    """Approval totals for one task linked to a streamed approval."""
+
+    task_id: UUID
+    approvals_count: int
+    approvals_pending_count: int
+
+
+class ApprovalStreamEvent(SQLModel):
+    """Payload of an `approval` event on the board approval stream."""
+
+    approval: ApprovalRead
+    pending_approvals_count: int
+    # A single object when one linked task has counts, a list for several; omitted when none.
+    task_counts: ApprovalTaskCounts | list[ApprovalTaskCounts] | None = None
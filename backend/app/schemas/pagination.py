@@ -2,11 +2,12 @@
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, TypeVar
+from typing import TYPE_CHECKING, Generic, TypeVar
 
 from fastapi import Query
 from fastapi_pagination.customization import CustomizedPage, UseParamsFields
 from fastapi_pagination.limit_offset import LimitOffsetPage
+from pydantic import BaseModel, Field
 
 T = TypeVar("T")
 
@@ -26,3 +27,15 @@ else:
             offset=Query(0, ge=0),
         ),
     ]
+
+
+class DefaultKeysetPage(BaseModel, Generic[T]):
+    """Newest-first page addressed by an opaque `(created_at, id)` cursor.
+
+    Pass `next_cursor` back as `cursor` to fetch the following page; it is `None`
+    once the listing is exhausted.
+    """
+
+    items: list[T] = Field(default_factory=list)
+    limit: int
+    next_cursor: str | None = None
@@ -3,10 +3,10 @@
 from __future__ import annotations
 
 from collections.abc import Iterable, Sequence
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 from uuid import UUID
 
-from sqlalchemy import case, delete, exists, func
+from sqlalchemy import Integer, case, delete, exists, func, literal, union_all
 from sqlmodel import col, select
 
 from app.models.approval_task_links import ApprovalTaskLink
@@ -15,6 +15,7 @@ from app.models.tasks import Task
 
 if TYPE_CHECKING:
     from sqlmodel.ext.asyncio.session import AsyncSession
+    from sqlmodel.sql.expression import Select
 
 TASK_ID_KEYS: tuple[str, ...] = ("task_id", "taskId", "taskID")
 TASK_IDS_KEYS: tuple[str, ...] = ("task_ids", "taskIds", "taskIDs")
@@ -106,6 +107,65 @@ async def load_task_ids_by_approval(
     return mapping
 
 
+async def load_task_links_by_approval(
+    session: AsyncSession,
+    *,
+    approval_ids: Iterable[UUID],
+) -> dict[UUID, list[tuple[UUID, str | None]]]:
+    """Return `(task_id, task_title)` pairs grouped by approval id in insertion order.
+
+    Legacy approvals without link rows fall back to their `approvals.task_id` in the
+    same query, and titles are joined in, so read paths need no follow-up lookups.
+    """
+    ids = list({*approval_ids})
+    if not ids:
+        return {}
+
+    linked_statement: Select[Any] = (
+        select(
+            col(ApprovalTaskLink.approval_id).label("approval_id"),
+            col(ApprovalTaskLink.task_id).label("task_id"),
+            col(Task.title).label("title"),
+            col(ApprovalTaskLink.created_at).label("sort_at"),
+        )
+        .outerjoin(Task, col(Task.id) == col(ApprovalTaskLink.task_id))
+        .where(col(ApprovalTaskLink.approval_id).in_(ids))
+    )
+    legacy_statement: Select[Any] = (
+        select(
+            col(Approval.id).label("approval_id"),
+            col(Approval.task_id).label("task_id"),
+            col(Task.title).label("title"),
+            col(Approval.created_at).label("sort_at"),
+        )
+        .outerjoin(Task, col(Task.id) == col(Approval.task_id))
+        .where(col(Approval.id).in_(ids))
+        .where(col(Approval.task_id).is_not(None))
+        .where(
+            ~exists(
+                select(1)
+                .where(col(ApprovalTaskLink.approval_id) == col(Approval.id))
+                .correlate(Approval),
+            ),
+        )
+    )
+    rows_subquery = union_all(linked_statement, legacy_statement).subquery()
+    rows = list(
+        await session.exec(
+            select(
+                rows_subquery.c.approval_id,
+                rows_subquery.c.task_id,
+                rows_subquery.c.title,
+            ).order_by(rows_subquery.c.sort_at.asc()),
+        ),
+    )
+
+    mapping: dict[UUID, list[tuple[UUID, str | None]]] = {approval_id: [] for approval_id in ids}
+    for approval_id, task_id, title in rows:
+        mapping.setdefault(approval_id, []).append((task_id, title))
+    return mapping
+
+
 async def replace_approval_task_links(
     session: AsyncSession,
     *,
@@ -131,11 +191,14 @@ async def lock_tasks_for_approval(
     normalized_task_ids = sorted({*task_ids}, key=str)
     if not normalized_task_ids:
         return
+    # FOR NO KEY UPDATE still serializes concurrent approval writers on the same tasks,
+    # but unlike FOR UPDATE it does not block inserts whose foreign keys reference
+    # these tasks (comments, links, activity) for the rest of the transaction.
     statement = (
         select(col(Task.id))
         .where(col(Task.id).in_(normalized_task_ids))
         .order_by(col(Task.id).asc())
-        .with_for_update()
+        .with_for_update(key_share=True)
     )
     # Materialize results so the lock query fully executes before proceeding.
     _ = list(await session.exec(statement))
@@ -153,31 +216,26 @@ async def pending_approval_conflicts_by_task(
     if not normalized_task_ids:
         return {}
 
-    linked_statement = (
+    # Linked and legacy (`approvals.task_id` without link rows) conflicts are checked in
+    # one round-trip; linked rows take precedence, then the earliest approval wins.
+    linked_statement: Select[Any] = (
         select(
-            col(ApprovalTaskLink.task_id),
-            col(Approval.id),
-            col(Approval.created_at),
+            col(ApprovalTaskLink.task_id).label("task_id"),
+            col(Approval.id).label("approval_id"),
+            col(Approval.created_at).label("created_at"),
+            literal(0, Integer).label("precedence"),
         )
         .join(Approval, col(Approval.id) == col(ApprovalTaskLink.approval_id))
         .where(col(Approval.board_id) == board_id)
         .where(col(Approval.status) == "pending")
         .where(col(ApprovalTaskLink.task_id).in_(normalized_task_ids))
-        .order_by(col(Approval.created_at).asc(), col(Approval.id).asc())
     )
-    if exclude_approval_id is not None:
-        linked_statement = linked_statement.where(col(Approval.id) != exclude_approval_id)
-    linked_rows = list(await session.exec(linked_statement))
-
-    conflicts: dict[UUID, UUID] = {}
-    for task_id, approval_id, _created_at in linked_rows:
-        conflicts.setdefault(task_id, approval_id)
-
-    legacy_statement = (
+    legacy_statement: Select[Any] = (
         select(
-            col(Approval.task_id),
-            col(Approval.id),
-            col(Approval.created_at),
+            col(Approval.task_id).label("task_id"),
+            col(Approval.id).label("approval_id"),
+            col(Approval.created_at).label("created_at"),
+            literal(1, Integer).label("precedence"),
         )
         .where(col(Approval.board_id) == board_id)
         .where(col(Approval.status) == "pending")
@@ -190,17 +248,24 @@ async def pending_approval_conflicts_by_task(
                 .correlate(Approval),
             ),
         )
-        .order_by(col(Approval.created_at).asc(), col(Approval.id).asc())
     )
     if exclude_approval_id is not None:
+        linked_statement = linked_statement.where(col(Approval.id) != exclude_approval_id)
         legacy_statement = legacy_statement.where(col(Approval.id) != exclude_approval_id)
-    legacy_rows = list(await session.exec(legacy_statement))
+    candidates = union_all(linked_statement, legacy_statement).subquery()
+    rows = list(
+        await session.exec(
+            select(candidates.c.task_id, candidates.c.approval_id).order_by(
+                candidates.c.precedence.asc(),
+                candidates.c.created_at.asc(),
+                candidates.c.approval_id.asc(),
+            ),
+        ),
+    )
 
-    for legacy_task_id_opt, approval_id, _created_at in legacy_rows:
-        if legacy_task_id_opt is None:
-            continue
-        # mypy: SQL rows can include NULL task_id; guard before using as dict[UUID, UUID] key.
-        conflicts.setdefault(legacy_task_id_opt, approval_id)
+    conflicts: dict[UUID, UUID] = {}
+    for task_id, approval_id in rows:
+        conflicts.setdefault(task_id, approval_id)
 
     return conflicts
 
@@ -15,7 +15,7 @@ from app.schemas.approvals import ApprovalRead
 from app.schemas.board_memory import BoardMemoryRead
 from app.schemas.boards import BoardRead
 from app.schemas.view_models import BoardSnapshot, TaskCardRead
-from app.services.approval_task_links import load_task_ids_by_approval, task_counts_for_board
+from app.services.approval_task_links import load_task_links_by_approval, task_counts_for_board
 from app.services.openclaw.provisioning_db import AgentLifecycleService
 from app.services.tags import TagState, load_tag_state
 from app.services.task_dependencies import (
@@ -143,31 +143,22 @@ async def build_board_snapshot(session: AsyncSession, board: Board) -> BoardSnap
         .limit(200)
         .all(session)
     )
-    approval_ids = [approval.id for approval in approvals]
-    task_ids_by_approval = await load_task_ids_by_approval(
+    # Linked task ids and titles, with the legacy single-task fallback resolved in SQL so
+    # older rows still render complete approval cards.
+    links_by_approval = await load_task_links_by_approval(
         session,
-        approval_ids=approval_ids,
+        approval_ids=[approval.id for approval in approvals],
     )
-    task_title_by_id = {task.id: task.title for task in tasks}
-    # Hydrate each approval with linked task metadata, falling back to legacy
-    # single-task fields so older rows still render complete approval cards.
-    approval_reads = [
-        _approval_to_read(
-            approval,
-            task_ids=(
-                linked_task_ids := task_ids_by_approval.get(
-                    approval.id,
-                    [approval.task_id] if approval.task_id is not None else [],
-                )
+    approval_reads: list[ApprovalRead] = []
+    for approval in approvals:
+        links = links_by_approval[approval.id]
+        approval_reads.append(
+            _approval_to_read(
+                approval,
+                task_ids=[task_id for task_id, _title in links],
+                task_titles=[title for _task_id, title in links if title is not None],
             ),
-            task_titles=[
-                task_title_by_id[task_id]
-                for task_id in linked_task_ids
-                if task_id in task_title_by_id
-            ],
         )
-        for approval in approvals
-    ]
 
     counts_by_task_id = await task_counts_for_board(session, board_id=board.id)
 
@@ -186,9 +177,7 @@ async def build_board_snapshot(session: AsyncSession, board: Board) -> BoardSnap
     chat_messages = (
         await BoardMemory.objects.filter_by(board_id=board.id)
         .filter(col(BoardMemory.is_chat).is_(True))
-        # Old/invalid rows (empty/whitespace-only content) can exist; exclude them to
-        # satisfy the NonEmptyStr response schema.
-        .filter(func.length(func.trim(col(BoardMemory.content))) > 0)
+        # Blank content is rejected by `ck_board_memory_content_nonblank`.
         .order_by(col(BoardMemory.created_at).desc())
         .limit(200)
         .all(session)
@@ -64,7 +64,11 @@ async def get_gateway_for_board(
     """Return the gateway for a board when present and valid; otherwise return None."""
     if board.gateway_id is None:
         return None
-    gateway = await Gateway.objects.by_id(board.gateway_id).first(session)
+    # `session.get` only skips the query when this same session already loaded the
+    # gateway (e.g. a group fan-out resolving several boards that share one). The
+    # chat and onboarding paths resolve once per fresh session and still pay one
+    # primary-key lookup.
+    gateway = await session.get(Gateway, board.gateway_id)
     if gateway is None:
         return None
     # Defensive guard: boards and gateways are tenant-scoped; reject cross-org mismatches.
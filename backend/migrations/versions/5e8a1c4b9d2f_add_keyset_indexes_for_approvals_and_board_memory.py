@@ -0,0 +1,39 @@
+"""add keyset indexes for approvals and board memory
+
+Revision ID: 5e8a1c4b9d2f
+Revises: b7a1d9c3e4f5
+Create Date: 2026-10-14 09:00:00.000000
+
+"""
+from __future__ import annotations
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "5e8a1c4b9d2f"
+down_revision = "b7a1d9c3e4f5"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Approval and board memory lists page newest-first with a
+    # `(created_at, id) < (:cursor_ts, :cursor_id)` seek predicate. Matching the
+    # sort order in the index lets each page be a single range scan + LIMIT.
+    op.create_index(
+        "ix_approvals_board_id_created_at_id",
+        "approvals",
+        ["board_id", sa.text("created_at DESC"), sa.text("id DESC")],
+    )
+    op.create_index(
+        "ix_board_memory_board_id_created_at_id",
+        "board_memory",
+        ["board_id", sa.text("created_at DESC"), sa.text("id DESC")],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_board_memory_board_id_created_at_id", table_name="board_memory")
+    op.drop_index("ix_approvals_board_id_created_at_id", table_name="approvals")
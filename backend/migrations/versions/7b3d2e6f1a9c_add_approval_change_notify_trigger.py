@@ -0,0 +1,50 @@
+"""add approval change notify trigger
+
+Revision ID: 7b3d2e6f1a9c
+Revises: 5e8a1c4b9d2f
+Create Date: 2026-10-14 10:00:00.000000
+
+"""
+from __future__ import annotations
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "7b3d2e6f1a9c"
+down_revision = "5e8a1c4b9d2f"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Approval SSE streams wake on NOTIFY instead of polling. The payload is
+    # `<board_id>:<approval_id>`; NOTIFY is delivered at commit, and identical
+    # payloads raised within one transaction are collapsed by Postgres.
+    op.execute(
+        sa.text(
+            """
+            CREATE OR REPLACE FUNCTION notify_approval_change() RETURNS trigger AS $$
+            BEGIN
+                PERFORM pg_notify('approvals', NEW.board_id::text || ':' || NEW.id::text);
+                RETURN NEW;
+            END;
+            $$ LANGUAGE plpgsql
+            """,
+        ),
+    )
+    op.execute(
+        sa.text(
+            """
+            CREATE TRIGGER approvals_notify_change
+            AFTER INSERT OR UPDATE ON approvals
+            FOR EACH ROW EXECUTE FUNCTION notify_approval_change()
+            """,
+        ),
+    )
+
+
+def downgrade() -> None:
+    op.execute(sa.text("DROP TRIGGER IF EXISTS approvals_notify_change ON approvals"))
+    op.execute(sa.text("DROP FUNCTION IF EXISTS notify_approval_change()"))
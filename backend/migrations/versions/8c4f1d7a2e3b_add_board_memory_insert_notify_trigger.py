@@ -0,0 +1,50 @@
+"""add board memory insert notify trigger
+
+Revision ID: 8c4f1d7a2e3b
+Revises: 7b3d2e6f1a9c
+Create Date: 2026-10-14 12:00:00.000000
+
+"""
+from __future__ import annotations
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "8c4f1d7a2e3b"
+down_revision = "7b3d2e6f1a9c"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Board memory SSE streams wake on NOTIFY and fetch only the new row. The
+    # payload is `<board_id>:<memory_id>`; memory rows are append-only, so only
+    # inserts are published.
+    op.execute(
+        sa.text(
+            """
+            CREATE OR REPLACE FUNCTION notify_board_memory_insert() RETURNS trigger AS $$
+            BEGIN
+                PERFORM pg_notify('board_memory', NEW.board_id::text || ':' || NEW.id::text);
+                RETURN NEW;
+            END;
+            $$ LANGUAGE plpgsql
+            """,
+        ),
+    )
+    op.execute(
+        sa.text(
+            """
+            CREATE TRIGGER board_memory_notify_insert
+            AFTER INSERT ON board_memory
+            FOR EACH ROW EXECUTE FUNCTION notify_board_memory_insert()
+            """,
+        ),
+    )
+
+
+def downgrade() -> None:
+    op.execute(sa.text("DROP TRIGGER IF EXISTS board_memory_notify_insert ON board_memory"))
+    op.execute(sa.text("DROP FUNCTION IF EXISTS notify_board_memory_insert()"))
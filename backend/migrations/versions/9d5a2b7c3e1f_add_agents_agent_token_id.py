@@ -0,0 +1,39 @@
+"""add agents.agent_token_id for O(1) agent token lookup
+
+Revision ID: 9d5a2b7c3e1f
+Revises: 8c4f1d7a2e3b
+Create Date: 2026-10-14 14:00:00.000000
+
+"""
+from __future__ import annotations
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "9d5a2b7c3e1f"
+down_revision = "8c4f1d7a2e3b"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # `v1.<token_id>.<secret>` tokens carry a public id so auth is one indexed
+    # fetch plus one PBKDF2 verify. The column stays nullable: agents keep their
+    # existing (id-less) tokens until they are next rotated.
+    op.add_column(
+        "agents",
+        sa.Column("agent_token_id", sa.String(length=22), nullable=True),
+    )
+    op.create_index(
+        "ix_agents_agent_token_id",
+        "agents",
+        ["agent_token_id"],
+        unique=True,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_agents_agent_token_id", table_name="agents")
+    op.drop_column("agents", "agent_token_id")
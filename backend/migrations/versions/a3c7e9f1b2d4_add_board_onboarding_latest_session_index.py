@@ -0,0 +1,35 @@
+"""add board onboarding latest-session index
+
+Revision ID: a3c7e9f1b2d4
+Revises: 9d5a2b7c3e1f
+Create Date: 2026-10-14 15:00:00.000000
+
+"""
+from __future__ import annotations
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "a3c7e9f1b2d4"
+down_revision = "9d5a2b7c3e1f"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Onboarding endpoints load a board's most recently updated session with
+    # `ORDER BY updated_at DESC LIMIT 1`; this makes it a single index probe.
+    op.create_index(
+        "ix_board_onboarding_sessions_board_id_updated_at",
+        "board_onboarding_sessions",
+        ["board_id", sa.text("updated_at DESC")],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(
+        "ix_board_onboarding_sessions_board_id_updated_at",
+        table_name="board_onboarding_sessions",
+    )
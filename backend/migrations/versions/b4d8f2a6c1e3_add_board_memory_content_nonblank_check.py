@@ -0,0 +1,33 @@
+"""add board memory non-blank content check
+
+Revision ID: b4d8f2a6c1e3
+Revises: a3c7e9f1b2d4
+Create Date: 2026-10-14 16:00:00.000000
+
+"""
+from __future__ import annotations
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = "b4d8f2a6c1e3"
+down_revision = "a3c7e9f1b2d4"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Blank rows were never readable: every board memory query filtered them out.
+    op.execute("DELETE FROM board_memory WHERE length(trim(content)) = 0")
+    # Add the constraint without a validating scan under the exclusive lock, then
+    # validate it separately while reads and writes continue.
+    op.execute(
+        "ALTER TABLE board_memory ADD CONSTRAINT ck_board_memory_content_nonblank "
+        "CHECK (length(trim(content)) > 0) NOT VALID"
+    )
+    op.execute("ALTER TABLE board_memory VALIDATE CONSTRAINT ck_board_memory_content_nonblank")
+
+
+def downgrade() -> None:
+    op.drop_constraint("ck_board_memory_content_nonblank", "board_memory", type_="check")
@@ -1,56 +1,155 @@
 # ruff: noqa: INP001
-"""Regression test sketch for agent-token lookup complexity.
+"""Regression tests for agent-token lookup complexity.
 
 Context:
-- Current implementation performs PBKDF2 verification in a loop over *all* agents
-  that have a token hash (`agent_auth._find_agent_for_token`).
-- This is O(N_agents) *and* each verify is expensive (PBKDF2 200k iterations).
-
-This test is marked xfail to document the desired behavior after a hardening
-refactor: O(1) lookup + single hash verify.
-
-Once token lookup is refactored, flip this to a normal passing test.
+- Token verification is PBKDF2 with 200k iterations, so lookup must not verify
+  a presented token against every agent's stored hash.
+- `v1.<token_id>.<secret>` tokens resolve through an indexed `agent_token_id`
+  and verify exactly once. Legacy id-less tokens are only scanned against agents
+  that still hold one.
 """
 
 from __future__ import annotations
 
-from types import SimpleNamespace
+from collections.abc import Iterator
+from uuid import uuid4
 
 import pytest
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
+from sqlmodel import SQLModel
+from sqlmodel.ext.asyncio.session import AsyncSession
 
 from app.core import agent_auth
+from app.core.agent_tokens import agent_token_id, generate_agent_token, hash_agent_token
+from app.models.agents import Agent
+from app.services.openclaw.db_agent_state import mint_agent_token
+
+
+@pytest.fixture(autouse=True)
+def _clear_verified_tokens() -> Iterator[None]:
+    # The verified-token cache is module state; keep every test independent of order.
+    agent_auth._verified_tokens.clear()
+    yield
+    agent_auth._verified_tokens.clear()
+
+
+async def _make_engine() -> AsyncEngine:
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    async with engine.connect() as conn, conn.begin():
+        await conn.run_sync(SQLModel.metadata.create_all)
+    return engine
+
+
+def _count_verifies(monkeypatch: pytest.MonkeyPatch) -> dict[str, int]:
+    calls = {"n": 0}
+    real_verify = agent_auth.verify_agent_token
+
+    def _counting_verify(token: str, stored_hash: str) -> bool:
+        calls["n"] += 1
+        return real_verify(token, stored_hash)
+
+    monkeypatch.setattr(agent_auth, "verify_agent_token", _counting_verify)
+    return calls
+
+
+def test_generated_tokens_embed_a_lookup_id() -> None:
+    token = generate_agent_token()
+    token_id = agent_token_id(token)
+
+    assert token_id is not None
+    assert len(token_id) == 22
+    assert token.startswith(f"v1.{token_id}.")
+    assert agent_token_id("legacy-token-without-id") is None
+    assert agent_token_id("v1..secret") is None
+    assert agent_token_id("v2.id.secret") is None
 
 
 @pytest.mark.asyncio
-@pytest.mark.xfail(
-    reason="Known DoS risk: agent token verification is currently O(N_agents)."
-    " Refactor token scheme/lookup to O(1) and make this pass.",
-    strict=False,
-)
 async def test_agent_token_lookup_should_not_verify_more_than_once(
     monkeypatch: pytest.MonkeyPatch,
 ) -> None:
-    # Fake a session that returns many agents with token hashes.
-    class _FakeSession:
-        async def exec(self, _stmt: object) -> list[object]:
+    engine = await _make_engine()
+    try:
+        async with AsyncSession(engine, expire_on_commit=False) as session:
             agents = []
-            for i in range(50):
-                agents.append(
-                    SimpleNamespace(agent_token_hash=f"pbkdf2_sha256$1$salt{i}$digest{i}")
-                )
-            return agents
+            for index in range(50):
+                agent = Agent(gateway_id=uuid4(), name=f"agent-{index}")
+                # Fake hashes keep setup cheap; only the verify count matters.
+                agent.agent_token_hash = f"pbkdf2_sha256$1$salt{index}$digest{index}"
+                agent.agent_token_id = agent_token_id(generate_agent_token())
+                agents.append(agent)
+            target = agents[7]
+            token = mint_agent_token(target)
+            session.add_all(agents)
+            await session.commit()
 
-    calls = {"n": 0}
+            calls = _count_verifies(monkeypatch)
+            assert await agent_auth._find_agent_for_token(session, "invalid") is None
+            assert calls["n"] == 0
+
+            found = await agent_auth._find_agent_for_token(session, token)
+            assert found is not None
+            assert found.id == target.id
+            assert calls["n"] == 1
+
+            forged = f"v1.{target.agent_token_id}.not-the-secret"
+            assert await agent_auth._find_agent_for_token(session, forged) is None
+            assert calls["n"] == 2
+    finally:
+        await engine.dispose()
+
+
+@pytest.mark.asyncio
+async def test_legacy_tokens_still_authenticate_by_scanning_legacy_agents(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    engine = await _make_engine()
+    try:
+        async with AsyncSession(engine, expire_on_commit=False) as session:
+            legacy_token = "legacy-opaque-token"
+            legacy = Agent(
+                gateway_id=uuid4(),
+                name="legacy",
+                agent_token_hash=hash_agent_token(legacy_token),
+            )
+            current = Agent(gateway_id=uuid4(), name="current")
+            mint_agent_token(current)
+            session.add_all([legacy, current])
+            await session.commit()
+
+            calls = _count_verifies(monkeypatch)
+            found = await agent_auth._find_agent_for_token(session, legacy_token)
+            assert found is not None
+            assert found.id == legacy.id
+            assert calls["n"] == 1
+    finally:
+        await engine.dispose()
 
-    def _fake_verify(_token: str, _stored_hash: str) -> bool:
-        calls["n"] += 1
-        # Always invalid
-        return False
 
-    monkeypatch.setattr(agent_auth, "verify_agent_token", _fake_verify)
+@pytest.mark.asyncio
+async def test_verified_tokens_are_cached_until_the_token_rotates(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    engine = await _make_engine()
+    try:
+        async with AsyncSession(engine, expire_on_commit=False) as session:
+            agent = Agent(gateway_id=uuid4(), name="cached")
+            token = mint_agent_token(agent)
+            session.add(agent)
+            await session.commit()
 
-    out = await agent_auth._find_agent_for_token(_FakeSession(), "invalid")  # type: ignore[arg-type]
-    assert out is None
+            calls = _count_verifies(monkeypatch)
+            for _ in range(3):
+                found = await agent_auth._find_agent_for_token(session, token)
+                assert found is not None
+                assert found.id == agent.id
+            assert calls["n"] == 1
 
-    # Desired behavior after refactor: avoid linear scan.
-    assert calls["n"] <= 1
+            mint_agent_token(agent)
+            session.add(agent)
+            await session.commit()
+            # The cached entry no longer matches, and the old token id is gone too.
+            assert await agent_auth._find_agent_for_token(session, token) is None
+            assert calls["n"] == 1
+    finally:
+        await engine.dispose()
@@ -0,0 +1,24 @@
+# ruff: noqa: INP001
+"""Route registration invariants for the assembled application."""
+
+from __future__ import annotations
+
+from collections import Counter
+
+from fastapi.routing import APIRoute
+
+from app.main import app
+
+
+def test_each_method_and_path_is_registered_once() -> None:
+    """A second router on the same prefix would silently shadow or fall through."""
+    registrations = Counter(
+        (method, route.path)
+        for route in app.routes
+        if isinstance(route, APIRoute)
+        for method in route.methods
+    )
+
+    duplicates = sorted(key for key, count in registrations.items() if count > 1)
+    assert duplicates == []
+    assert ("GET", "/api/v1/boards/{board_id}/approvals/stream") in registrations
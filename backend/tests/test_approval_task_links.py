@@ -1,8 +1,10 @@
 from __future__ import annotations
 
+from datetime import datetime, timedelta
 from uuid import UUID, uuid4
 
 import pytest
+from sqlalchemy.dialects import postgresql
 from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
 from sqlmodel import SQLModel
 from sqlmodel.ext.asyncio.session import AsyncSession
@@ -14,7 +16,10 @@ from app.models.organizations import Organization
 from app.models.tasks import Task
 from app.services.approval_task_links import (
     load_task_ids_by_approval,
+    load_task_links_by_approval,
+    lock_tasks_for_approval,
     normalize_task_ids,
+    pending_approval_conflicts_by_task,
     task_counts_for_board,
 )
 
@@ -151,3 +156,163 @@ async def test_load_task_ids_by_approval_preserves_insert_order() -> None:
             assert mapping[approval.id] == [task_a, task_b, task_c]
     finally:
         await engine.dispose()
+
+
+@pytest.mark.asyncio
+async def test_load_task_links_by_approval_includes_titles_in_insert_order() -> None:
+    engine = await _make_engine()
+    try:
+        async with await _make_session(engine) as session:
+            board_id, task_a, task_b, _task_c = await _seed_board(session)
+
+            linked = Approval(
+                board_id=board_id,
+                task_id=task_b,
+                action_type="task.update",
+                confidence=88,
+                status="pending",
+            )
+            unlinked = Approval(
+                board_id=board_id,
+                action_type="task.comment",
+                confidence=60,
+                status="pending",
+            )
+            session.add(linked)
+            session.add(unlinked)
+            await session.flush()
+            session.add(ApprovalTaskLink(approval_id=linked.id, task_id=task_b))
+            session.add(ApprovalTaskLink(approval_id=linked.id, task_id=task_a))
+            await session.commit()
+
+            mapping = await load_task_links_by_approval(
+                session,
+                approval_ids=[linked.id, unlinked.id],
+            )
+            assert mapping[linked.id] == [(task_b, "b"), (task_a, "a")]
+            assert mapping[unlinked.id] == []
+    finally:
+        await engine.dispose()
+
+
+@pytest.mark.asyncio
+async def test_load_task_links_by_approval_falls_back_to_legacy_task_id() -> None:
+    engine = await _make_engine()
+    try:
+        async with await _make_session(engine) as session:
+            board_id, task_a, _task_b, task_c = await _seed_board(session)
+
+            legacy = Approval(
+                board_id=board_id,
+                task_id=task_c,
+                action_type="task.update",
+                confidence=70,
+                status="approved",
+            )
+            linked = Approval(
+                board_id=board_id,
+                task_id=task_c,
+                action_type="task.update",
+                confidence=70,
+            )
+            session.add_all([legacy, linked])
+            await session.flush()
+            session.add(ApprovalTaskLink(approval_id=linked.id, task_id=task_a))
+            await session.commit()
+
+            mapping = await load_task_links_by_approval(
+                session,
+                approval_ids=[legacy.id, linked.id],
+            )
+            assert mapping[legacy.id] == [(task_c, "c")]
+            # Link rows win over the legacy column once they exist.
+            assert mapping[linked.id] == [(task_a, "a")]
+    finally:
+        await engine.dispose()
+
+
+@pytest.mark.asyncio
+async def test_pending_approval_conflicts_prefers_linked_rows_then_earliest() -> None:
+    engine = await _make_engine()
+    try:
+        async with await _make_session(engine) as session:
+            board_id, task_a, task_b, task_c = await _seed_board(session)
+            base = datetime(2026, 2, 1, 12, 0, 0)
+
+            legacy_a = Approval(
+                board_id=board_id,
+                task_id=task_a,
+                action_type="task.update",
+                confidence=70,
+                created_at=base,
+            )
+            linked_a = Approval(
+                board_id=board_id,
+                action_type="task.update",
+                confidence=80,
+                created_at=base + timedelta(minutes=2),
+            )
+            linked_a_earlier = Approval(
+                board_id=board_id,
+                action_type="task.update",
+                confidence=80,
+                created_at=base + timedelta(minutes=1),
+            )
+            legacy_b = Approval(
+                board_id=board_id,
+                task_id=task_b,
+                action_type="task.update",
+                confidence=70,
+                created_at=base,
+            )
+            resolved_c = Approval(
+                board_id=board_id,
+                task_id=task_c,
+                action_type="task.update",
+                confidence=70,
+                status="approved",
+                created_at=base,
+            )
+            session.add_all([legacy_a, linked_a, linked_a_earlier, legacy_b, resolved_c])
+            await session.flush()
+            session.add(ApprovalTaskLink(approval_id=linked_a.id, task_id=task_a))
+            session.add(ApprovalTaskLink(approval_id=linked_a_earlier.id, task_id=task_a))
+            await session.commit()
+
+            conflicts = await pending_approval_conflicts_by_task(
+                session,
+                board_id=board_id,
+                task_ids=[task_a, task_b, task_c],
+            )
+            assert conflicts == {task_a: linked_a_earlier.id, task_b: legacy_b.id}
+
+            conflicts = await pending_approval_conflicts_by_task(
+                session,
+                board_id=board_id,
+                task_ids=[task_a],
+                exclude_approval_id=linked_a_earlier.id,
+            )
+            assert conflicts == {task_a: linked_a.id}
+    finally:
+        await engine.dispose()
+
+
+@pytest.mark.asyncio
+async def test_lock_tasks_for_approval_takes_no_key_update_locks_in_id_order() -> None:
+    captured: list[object] = []
+
+    class _CaptureSession:
+        async def exec(self, statement: object) -> list[object]:
+            captured.append(statement)
+            return []
+
+    task_ids = [uuid4(), uuid4()]
+    await lock_tasks_for_approval(
+        _CaptureSession(),  # type: ignore[arg-type]
+        task_ids=[*task_ids, task_ids[0]],
+    )
+
+    (statement,) = captured
+    sql = str(statement.compile(dialect=postgresql.dialect()))  # type: ignore[attr-defined]
+    assert sql.endswith("FOR NO KEY UPDATE")
+    assert "ORDER BY tasks.id ASC" in sql
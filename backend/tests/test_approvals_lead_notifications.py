@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from collections.abc import Iterator
 from dataclasses import dataclass
 from typing import Any
 from uuid import UUID, uuid4
@@ -7,6 +8,7 @@ from uuid import UUID, uuid4
 import pytest
 
 from app.api import approvals
+from app.core.background import drain_background_tasks
 from app.models.agents import Agent
 from app.models.approvals import Approval
 from app.models.boards import Board
@@ -49,11 +51,26 @@ class _FakeSession:
     async def refresh(self, _value: object) -> None:
         self.refreshed += 1
 
+    async def __aenter__(self) -> _FakeSession:
+        return self
+
+    async def __aexit__(self, *_exc: object) -> None:
+        return None
+
+
+@pytest.fixture(autouse=True)
+def _clear_gateway_configs() -> Iterator[None]:
+    # The gateway config cache is module state; keep every test independent of order.
+    approvals._gateway_configs.clear()
+    yield
+    approvals._gateway_configs.clear()
+
 
 def _board() -> Board:
     return Board(
         id=uuid4(),
         organization_id=uuid4(),
+        gateway_id=uuid4(),
         name="Ops",
         slug="ops",
     )
@@ -130,7 +147,11 @@ async def test_update_approval_notifies_lead_when_approved(
 
     monkeypatch.setattr(approvals, "load_task_ids_by_approval", _fake_load_task_ids_by_approval)
 
-    async def _fake_reads(_session: object, _approvals: list[Approval]) -> list[ApprovalRead]:
+    async def _fake_reads(
+        _session: object,
+        _approvals: list[Approval],
+        **_kwargs: Any,
+    ) -> list[ApprovalRead]:
         return [ApprovalRead.model_validate(approval, from_attributes=True)]
 
     monkeypatch.setattr(
@@ -139,6 +160,9 @@ async def test_update_approval_notifies_lead_when_approved(
         _fake_reads,
     )
 
+    # The lead notification runs after the response on its own session.
+    monkeypatch.setattr(approvals, "async_session_maker", lambda: session)
+
     updated = await approvals.update_approval(
         approval_id=str(approval.id),
         payload=ApprovalUpdate(status="approved"),
@@ -147,6 +171,7 @@ async def test_update_approval_notifies_lead_when_approved(
     )
 
     assert updated.status == "approved"
+    await drain_background_tasks(timeout=1)
     assert captured["session_key"] == "agent:lead:session"
     assert captured["agent_name"] == "Lead Agent"
     assert "APPROVAL RESOLVED" in captured["message"]
@@ -174,7 +199,11 @@ async def test_update_approval_skips_notify_when_status_not_resolved(
 
     monkeypatch.setattr(approvals, "_notify_lead_on_approval_resolution", _fake_notify)
 
-    async def _fake_reads(_session: object, _approvals: list[Approval]) -> list[ApprovalRead]:
+    async def _fake_reads(
+        _session: object,
+        _approvals: list[Approval],
+        **_kwargs: Any,
+    ) -> list[ApprovalRead]:
         return [ApprovalRead.model_validate(approval, from_attributes=True)]
 
     monkeypatch.setattr(
@@ -201,3 +230,205 @@ def test_approval_resolution_message_uses_rejected_enum_value() -> None:
     assert "APPROVAL RESOLVED" in message
     assert f"Approval ID: {approval.id}" in message
     assert "Decision: rejected" in message
+
+
+def test_approval_resolution_message_lists_linked_task_ids() -> None:
+    board = _board()
+    approval = _approval(board_id=board.id, status="approved")
+    task_ids = [uuid4(), uuid4()]
+
+    message = approvals._approval_resolution_message(
+        board=board,
+        approval=approval,
+        task_ids=task_ids,
+    )
+
+    assert message == (
+        "APPROVAL RESOLVED\n"
+        "Board: Ops\n"
+        f"Approval ID: {approval.id}\n"
+        "Action: task.execute\n"
+        "Decision: approved\n"
+        "Confidence: 91\n"
+        f"Task IDs: {task_ids[0]}, {task_ids[1]}\n"
+        "\n"
+        "Take action: continue execution using the final approval decision."
+    )
+
+
+@pytest.mark.asyncio
+async def test_lead_gateway_config_is_cached_until_a_send_fails(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    board = _board()
+    leads = [
+        Agent(
+            id=uuid4(),
+            board_id=board.id,
+            gateway_id=uuid4(),
+            name=name,
+            is_board_lead=True,
+            openclaw_session_id=f"agent:{name.lower()}:session",
+        )
+        for name in ("Lead", "Successor", "Successor")
+    ]
+    lookups = {"lead": 0, "config": 0}
+    send_errors: list[str | None] = [None, "gateway unavailable", None]
+    sent_to: list[str] = []
+
+    async def _fake_resolve_lead(*_args: Any, **_kwargs: Any) -> Agent:
+        lookups["lead"] += 1
+        return leads[lookups["lead"] - 1]
+
+    async def _fake_optional_gateway_config_for_board(
+        self: approvals.GatewayDispatchService,
+        _board: Board,
+    ) -> GatewayClientConfig:
+        _ = self
+        lookups["config"] += 1
+        return GatewayClientConfig(url="ws://gateway.example/ws", token=None)
+
+    async def _fake_try_send_agent_message(
+        self: approvals.GatewayDispatchService,
+        **kwargs: Any,
+    ) -> str | None:
+        _ = self
+        sent_to.append(kwargs["session_key"])
+        return send_errors.pop(0)
+
+    async def _fake_load_task_ids_by_approval(
+        _session: object,
+        *,
+        approval_ids: list[UUID],
+    ) -> dict[UUID, list[UUID]]:
+        return {approval_id: [] for approval_id in approval_ids}
+
+    monkeypatch.setattr(approvals, "_resolve_board_lead", _fake_resolve_lead)
+    monkeypatch.setattr(
+        approvals.GatewayDispatchService,
+        "optional_gateway_config_for_board",
+        _fake_optional_gateway_config_for_board,
+    )
+    monkeypatch.setattr(
+        approvals.GatewayDispatchService,
+        "try_send_agent_message",
+        _fake_try_send_agent_message,
+    )
+    monkeypatch.setattr(approvals, "load_task_ids_by_approval", _fake_load_task_ids_by_approval)
+
+    session = _FakeSession()
+    for _ in range(2):
+        await approvals._notify_lead_on_approval_resolution(
+            session=session,  # type: ignore[arg-type]
+            board=board,
+            approval=_approval(board_id=board.id, status="approved"),
+        )
+    # The lead is re-read each time, so a reassigned lead is notified right away;
+    # the gateway config was reused until its failed send evicted it.
+    assert sent_to == ["agent:lead:session", "agent:successor:session"]
+    assert lookups == {"lead": 2, "config": 1}
+    assert approvals._gateway_configs == {}
+
+    await approvals._notify_lead_on_approval_resolution(
+        session=session,  # type: ignore[arg-type]
+        board=board,
+        approval=_approval(board_id=board.id, status="rejected"),
+    )
+    assert lookups == {"lead": 3, "config": 2}
+
+    event_types = [item.event_type for item in session.added if hasattr(item, "event_type")]
+    assert event_types == [
+        "approval.lead_notified",
+        "approval.lead_notify_failed",
+        "approval.lead_notified",
+    ]
+
+
+@pytest.mark.asyncio
+async def test_lead_notify_target_does_not_cache_a_board_without_a_gateway(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    board = _board()
+    lead = Agent(
+        id=uuid4(),
+        board_id=board.id,
+        gateway_id=uuid4(),
+        name="Lead Agent",
+        is_board_lead=True,
+        openclaw_session_id="agent:lead:session",
+    )
+    configs: list[GatewayClientConfig | None] = [
+        None,
+        GatewayClientConfig(url="ws://gateway.example/ws", token=None),
+    ]
+
+    async def _fake_resolve_lead(*_args: Any, **_kwargs: Any) -> Agent:
+        return lead
+
+    async def _fake_optional_gateway_config_for_board(
+        self: approvals.GatewayDispatchService,
+        _board: Board,
+    ) -> GatewayClientConfig | None:
+        _ = self
+        return configs.pop(0)
+
+    monkeypatch.setattr(approvals, "_resolve_board_lead", _fake_resolve_lead)
+    monkeypatch.setattr(
+        approvals.GatewayDispatchService,
+        "optional_gateway_config_for_board",
+        _fake_optional_gateway_config_for_board,
+    )
+
+    session = _FakeSession()
+    assert await approvals._lead_notify_target(session, board) is None  # type: ignore[arg-type]
+    # A gateway attached right after the miss is picked up on the next resolution.
+    target = await approvals._lead_notify_target(session, board)  # type: ignore[arg-type]
+    assert target is not None
+    assert target.session_key == "agent:lead:session"
+
+
+@pytest.mark.asyncio
+async def test_lead_gateway_config_follows_board_gateway_changes(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    board = _board()
+    lead = Agent(
+        id=uuid4(),
+        board_id=board.id,
+        gateway_id=uuid4(),
+        name="Lead Agent",
+        is_board_lead=True,
+        openclaw_session_id="agent:lead:session",
+    )
+
+    async def _fake_resolve_lead(*_args: Any, **_kwargs: Any) -> Agent:
+        return lead
+
+    async def _fake_optional_gateway_config_for_board(
+        self: approvals.GatewayDispatchService,
+        board: Board,
+    ) -> GatewayClientConfig:
+        _ = self
+        return GatewayClientConfig(url=f"ws://{board.gateway_id}.example/ws", token=None)
+
+    monkeypatch.setattr(approvals, "_resolve_board_lead", _fake_resolve_lead)
+    monkeypatch.setattr(
+        approvals.GatewayDispatchService,
+        "optional_gateway_config_for_board",
+        _fake_optional_gateway_config_for_board,
+    )
+
+    session = _FakeSession()
+    target = await approvals._lead_notify_target(session, board)  # type: ignore[arg-type]
+    assert target is not None
+    assert target.config.url == f"ws://{board.gateway_id}.example/ws"
+
+    # Re-pointing the board misses the cache without any send failing first.
+    old_gateway_id, board.gateway_id = board.gateway_id, uuid4()
+    target = await approvals._lead_notify_target(session, board)  # type: ignore[arg-type]
+    assert target is not None
+    assert target.config.url == f"ws://{board.gateway_id}.example/ws"
+
+    # Gateway edits drop only that gateway's entries.
+    approvals.invalidate_gateway_configs(board.gateway_id)
+    assert list(approvals._gateway_configs) == [(board.id, old_gateway_id)]
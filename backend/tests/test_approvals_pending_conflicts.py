@@ -180,3 +180,37 @@ async def test_update_approval_rejects_reopening_to_pending_with_existing_pendin
             ]
     finally:
         await engine.dispose()
+
+
+@pytest.mark.asyncio
+async def test_update_approval_reopening_returns_linked_tasks_and_titles() -> None:
+    engine = await _make_engine()
+    try:
+        async with await _make_session(engine) as session:
+            board, task_ids = await _seed_board_with_tasks(session, task_count=2)
+            resolved = await approvals_api.create_approval(
+                payload=ApprovalCreate(
+                    action_type="task.review",
+                    task_ids=task_ids,
+                    payload={"reason": "Review decision completed earlier."},
+                    confidence=90,
+                    status="approved",
+                ),
+                board=board,
+                session=session,
+            )
+
+            reopened = await approvals_api.update_approval(
+                approval_id=resolved.id,  # type: ignore[arg-type]
+                payload=ApprovalUpdate(status="pending"),
+                board=board,
+                session=session,
+            )
+
+            assert reopened.status == "pending"
+            assert reopened.task_id == task_ids[0]
+            assert reopened.task_ids == task_ids
+            assert reopened.task_titles == [f"task-{task_id}" for task_id in task_ids]
+    finally:
+        approvals_api._pending_counts.clear()
+        await engine.dispose()
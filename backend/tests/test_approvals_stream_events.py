@@ -0,0 +1,485 @@
+# ruff: noqa: INP001
+"""Approval stream polling, fan-out, and NOTIFY wakeup behavior."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import time
+from datetime import datetime, timedelta
+from uuid import uuid4
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
+from sqlmodel import SQLModel
+from sqlmodel.ext.asyncio.session import AsyncSession
+from sse_starlette.event import ServerSentEvent
+
+from app.api import approvals as approvals_api
+from app.core.time import utcnow
+from app.db.notifications import PgNotificationListener, listener_conninfo
+from app.models.approvals import Approval
+from app.models.boards import Board
+from app.models.organizations import Organization
+from app.models.tasks import Task
+from app.schemas.approvals import ApprovalCreate, ApprovalRead
+
+
+async def _make_engine() -> AsyncEngine:
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    async with engine.connect() as conn, conn.begin():
+        await conn.run_sync(SQLModel.metadata.create_all)
+    return engine
+
+
+def _item(event: ServerSentEvent, *, updated_at: datetime) -> approvals_api._ApprovalStreamItem:
+    return approvals_api._ApprovalStreamItem(
+        approval_id=uuid4(),
+        updated_at=updated_at,
+        event=event,
+    )
+
+
+async def _seed_board(session: AsyncSession) -> Board:
+    org_id = uuid4()
+    board = Board(id=uuid4(), organization_id=org_id, name="b", slug="b")
+    session.add(Organization(id=org_id, name=f"org-{org_id}"))
+    session.add(board)
+    await session.commit()
+    return board
+
+
+@pytest.mark.asyncio
+async def test_fetch_approval_events_returns_created_and_resolved_since() -> None:
+    engine = await _make_engine()
+    try:
+        async with AsyncSession(engine, expire_on_commit=False) as session:
+            board = await _seed_board(session)
+            base = datetime(2026, 2, 1, 12, 0, 0)
+            old_pending = Approval(
+                board_id=board.id,
+                action_type="task.execute",
+                confidence=80,
+                created_at=base,
+            )
+            new_pending = Approval(
+                board_id=board.id,
+                action_type="task.execute",
+                confidence=80,
+                created_at=base + timedelta(minutes=5),
+            )
+            resolved = Approval(
+                board_id=board.id,
+                action_type="task.review",
+                confidence=90,
+                status="approved",
+                created_at=base,
+                resolved_at=base + timedelta(minutes=6),
+            )
+            session.add_all([old_pending, new_pending, resolved])
+            await session.commit()
+
+            approvals, pending_count = await approvals_api._fetch_approval_events(
+                session,
+                board.id,
+                base + timedelta(minutes=1),
+            )
+            assert {approval.id for approval in approvals} == {new_pending.id, resolved.id}
+            assert pending_count == 2
+    finally:
+        approvals_api._pending_counts.clear()
+        await engine.dispose()
+
+
+@pytest.mark.asyncio
+async def test_approval_stream_event_payload_matches_pydantic_json_mode() -> None:
+    engine = await _make_engine()
+    try:
+        async with AsyncSession(engine, expire_on_commit=False) as session:
+            board = await _seed_board(session)
+            base = datetime(2026, 2, 1, 12, 0, 0)
+            approval = Approval(
+                board_id=board.id,
+                action_type="task.execute",
+                payload={"reason": "ship it", "nested": {"n": 1}},
+                confidence=87.5,
+                rubric_scores={"risk": 2},
+                created_at=base + timedelta(microseconds=123456),
+            )
+            session.add(approval)
+            await session.commit()
+
+            items = await approvals_api._approval_stream_events(
+                session,
+                board_id=board.id,
+                since=base,
+            )
+
+            assert [item.version for item in items] == [(approval.id, approval.created_at)]
+            assert [item.event.event for item in items] == ["approval"]
+            payload = json.loads(items[0].event.data)
+            expected = ApprovalRead.model_validate(approval, from_attributes=True)
+            assert payload["approval"] == expected.model_dump(mode="json")
+            assert payload["pending_approvals_count"] == 1
+            assert "task_counts" not in payload
+    finally:
+        approvals_api._pending_counts.clear()
+        await engine.dispose()
+
+
+@pytest.mark.asyncio
+async def test_approval_stream_event_task_counts_shape_follows_linked_tasks() -> None:
+    engine = await _make_engine()
+    try:
+        async with AsyncSession(engine, expire_on_commit=False) as session:
+            board = await _seed_board(session)
+            task_a, task_b = Task(board_id=board.id, title="a"), Task(board_id=board.id, title="b")
+            session.add_all([task_a, task_b])
+            await session.commit()
+            since = utcnow() - timedelta(seconds=1)
+            for task_ids in ([task_a.id], [task_a.id, task_b.id]):
+                await approvals_api.create_approval(
+                    payload=ApprovalCreate(
+                        action_type="task.execute",
+                        task_ids=task_ids,
+                        payload={"reason": "Needs sign-off."},
+                        confidence=80,
+                        status="approved",
+                    ),
+                    board=board,
+                    session=session,
+                )
+
+            items = await approvals_api._approval_stream_events(
+                session,
+                board_id=board.id,
+                since=since,
+            )
+
+            payloads = sorted(
+                (json.loads(item.event.data) for item in items),
+                key=lambda item: len(item["approval"]["task_ids"]),
+            )
+            assert payloads[0]["task_counts"] == {
+                "task_id": str(task_a.id),
+                "approvals_count": 2,
+                "approvals_pending_count": 0,
+            }
+            assert [item["task_id"] for item in payloads[1]["task_counts"]] == [
+                str(task_a.id),
+                str(task_b.id),
+            ]
+    finally:
+        approvals_api._pending_counts.clear()
+        await engine.dispose()
+
+
+@pytest.mark.asyncio
+async def test_pending_approvals_count_is_cached_until_local_write_invalidates() -> None:
+    engine = await _make_engine()
+    try:
+        async with AsyncSession(engine, expire_on_commit=False) as session:
+            board = await _seed_board(session)
+            since = datetime(2026, 1, 1)
+            approvals_api._invalidate_pending_count(board.id)
+            session.add(Approval(board_id=board.id, action_type="task.execute", confidence=80))
+            await session.commit()
+
+            _, pending_count = await approvals_api._fetch_approval_events(session, board.id, since)
+            assert pending_count == 1
+
+            # Writes that bypass the API are only picked up once the TTL lapses.
+            session.add(Approval(board_id=board.id, action_type="task.execute", confidence=80))
+            await session.commit()
+            _, pending_count = await approvals_api._fetch_approval_events(session, board.id, since)
+            assert pending_count == 1
+
+            await approvals_api.create_approval(
+                payload=ApprovalCreate(
+                    action_type="task.execute",
+                    payload={"reason": "Needs sign-off."},
+                    confidence=80,
+                    status="pending",
+                ),
+                board=board,
+                session=session,
+            )
+            approvals, pending_count = await approvals_api._fetch_approval_events(
+                session,
+                board.id,
+                since,
+            )
+            assert len(approvals) == 3
+            assert pending_count == 3
+    finally:
+        approvals_api._pending_counts.clear()
+        await engine.dispose()
+
+
+@pytest.mark.asyncio
+async def test_approval_stream_poller_fans_out_one_poll_to_all_subscribers(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    board_id = uuid4()
+    polls = {"n": 0}
+    event = ServerSentEvent(event="approval", data="{}")
+
+    class _NullSession:
+        async def __aenter__(self) -> object:
+            return object()
+
+        async def __aexit__(self, *_exc: object) -> None:
+            return None
+
+    async def _fake_events(
+        _session: object,
+        *,
+        board_id: object,
+        since: datetime,
+    ) -> list[approvals_api._ApprovalStreamItem]:
+        polls["n"] += 1
+        if polls["n"] == 1:
+            return [_item(event, updated_at=since)]
+        return []
+
+    monkeypatch.setattr(approvals_api, "async_session_maker", _NullSession)
+    monkeypatch.setattr(approvals_api, "_approval_stream_events", _fake_events)
+    monkeypatch.setattr(approvals_api, "STREAM_POLL_SECONDS", 0.01)
+    monkeypatch.setattr(approvals_api, "notification_listener", PgNotificationListener(None))
+
+    poller, first = approvals_api._subscribe_approval_stream(board_id)
+    same_poller, second = approvals_api._subscribe_approval_stream(board_id)
+    assert same_poller is poller
+
+    assert (await asyncio.wait_for(first.get(), timeout=1)).event is event
+    assert (await asyncio.wait_for(second.get(), timeout=1)).event is event
+
+    approvals_api._unsubscribe_approval_stream(poller, first)
+    assert approvals_api._board_pollers[board_id] is poller
+    approvals_api._unsubscribe_approval_stream(poller, second)
+    assert board_id not in approvals_api._board_pollers
+    assert poller.task is not None
+    with pytest.raises(asyncio.CancelledError):
+        await poller.task
+
+
+@pytest.mark.asyncio
+async def test_approval_notification_wakes_only_matching_board_poller(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    listener = PgNotificationListener(None)
+    listener.connected = True
+    polls: dict[object, int] = {}
+
+    class _NullSession:
+        async def __aenter__(self) -> object:
+            return object()
+
+        async def __aexit__(self, *_exc: object) -> None:
+            return None
+
+    async def _fake_events(
+        _session: object,
+        *,
+        board_id: object,
+        since: datetime,
+    ) -> list[approvals_api._ApprovalStreamItem]:
+        polls[board_id] = polls.get(board_id, 0) + 1
+        return [_item(ServerSentEvent(event="approval", data=str(board_id)), updated_at=since)]
+
+    monkeypatch.setattr(approvals_api, "async_session_maker", _NullSession)
+    monkeypatch.setattr(approvals_api, "_approval_stream_events", _fake_events)
+    monkeypatch.setattr(approvals_api, "notification_listener", listener)
+
+    board_a, board_b = uuid4(), uuid4()
+    poller_a, queue_a = approvals_api._subscribe_approval_stream(board_a)
+    poller_b, queue_b = approvals_api._subscribe_approval_stream(board_b)
+    try:
+        # The initial fetch runs immediately; afterwards both loops wait for a push.
+        await asyncio.wait_for(queue_a.get(), timeout=1)
+        await asyncio.wait_for(queue_b.get(), timeout=1)
+
+        listener._dispatch("approvals", f"{board_a}:{uuid4()}")
+        woken = await asyncio.wait_for(queue_a.get(), timeout=1)
+        assert woken.event.data == str(board_a)
+        await asyncio.sleep(0.05)
+        assert queue_b.empty()
+        assert polls == {board_a: 2, board_b: 1}
+
+        listener._dispatch("approvals", None)
+        await asyncio.wait_for(queue_a.get(), timeout=1)
+        await asyncio.wait_for(queue_b.get(), timeout=1)
+    finally:
+        approvals_api._unsubscribe_approval_stream(poller_a, queue_a)
+        approvals_api._unsubscribe_approval_stream(poller_b, queue_b)
+
+
+def test_approval_notification_invalidates_cached_pending_counts() -> None:
+    board_a, board_b = uuid4(), uuid4()
+    loaded_at = time.monotonic()
+    try:
+        approvals_api._pending_counts.update({board_a: (1, loaded_at), board_b: (2, loaded_at)})
+
+        # A write on another worker reaches this one only through its NOTIFY.
+        approvals_api._on_approval_notification(f"{board_a}:{uuid4()}")
+        assert approvals_api._pending_counts == {board_b: (2, loaded_at)}
+
+        approvals_api._on_approval_notification(None)
+        assert approvals_api._pending_counts == {}
+    finally:
+        approvals_api._pending_counts.clear()
+
+
+def test_listener_conninfo_only_targets_postgres() -> None:
+    assert listener_conninfo("sqlite+aiosqlite:///:memory:") is None
+    assert (
+        listener_conninfo("postgresql+psycopg://user:secret@db:5432/app")
+        == "postgresql://user:secret@db:5432/app"
+    )
+
+
+def test_approval_stream_poller_drops_oldest_events_for_stalled_subscribers() -> None:
+    poller = approvals_api._ApprovalStreamPoller(uuid4())
+    stalled: approvals_api.StreamQueue = asyncio.Queue(maxsize=2)
+    keeping_up: approvals_api.StreamQueue = asyncio.Queue(maxsize=2)
+    poller.subscribers.update({stalled, keeping_up})
+    events = [ServerSentEvent(event="approval", data=str(index)) for index in range(3)]
+    items = [_item(event, updated_at=poller.last_seen) for event in events]
+
+    poller._publish(items[:2])
+    keeping_up.get_nowait()
+    keeping_up.get_nowait()
+    poller._publish(items[2:])
+
+    assert [stalled.get_nowait().event.data for _ in range(stalled.qsize())] == ["1", "2"]
+    assert keeping_up.get_nowait() is items[2]
+    assert poller.dropped_events == 1
+
+
+def test_approval_stream_poller_skips_versions_already_published_at_its_cursor() -> None:
+    poller = approvals_api._ApprovalStreamPoller(uuid4())
+    queue: approvals_api.StreamQueue = asyncio.Queue()
+    poller.subscribers.add(queue)
+    cursor = poller.last_seen + timedelta(seconds=1)
+    boundary = _item(ServerSentEvent(event="approval", data="boundary"), updated_at=cursor)
+
+    poller._publish([boundary])
+    # The next inclusive range query returns the boundary version again.
+    resolved = approvals_api._ApprovalStreamItem(
+        approval_id=boundary.approval_id,
+        updated_at=cursor + timedelta(seconds=1),
+        event=ServerSentEvent(event="approval", data="resolved"),
+    )
+    poller._publish([boundary, resolved])
+
+    assert [queue.get_nowait().event.data for _ in range(queue.qsize())] == [
+        "boundary",
+        "resolved",
+    ]
+    assert poller.boundary_versions == {resolved.version}
+
+
+@pytest.mark.asyncio
+async def test_stream_replay_leaves_versions_the_poller_will_deliver_to_the_queue(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    engine = await _make_engine()
+    monkeypatch.setattr(
+        approvals_api,
+        "async_session_maker",
+        lambda: AsyncSession(engine, expire_on_commit=False),
+    )
+
+    class _DisconnectedRequest:
+        async def is_disconnected(self) -> bool:
+            return True
+
+    try:
+        async with AsyncSession(engine, expire_on_commit=False) as session:
+            board = await _seed_board(session)
+        joined_at = datetime(2026, 2, 1, 12, 0, 0)
+        before, published, unpublished, after = (
+            Approval(
+                board_id=board.id,
+                action_type="task.execute",
+                confidence=80,
+                created_at=created_at,
+            )
+            for created_at in (
+                joined_at - timedelta(seconds=1),
+                joined_at,
+                joined_at,
+                joined_at + timedelta(seconds=1),
+            )
+        )
+        async with AsyncSession(engine, expire_on_commit=False) as session:
+            session.add_all([before, published, unpublished, after])
+            await session.commit()
+
+        # A poller that already published one version at its cursor, and is idle.
+        poller = approvals_api._ApprovalStreamPoller(board.id)
+        poller.last_seen = joined_at
+        poller.boundary_versions = {(published.id, joined_at)}
+        poller.task = asyncio.create_task(asyncio.Event().wait())
+        approvals_api._board_pollers[board.id] = poller
+
+        response = await approvals_api.stream_approvals(
+            request=_DisconnectedRequest(),  # type: ignore[arg-type]
+            board=board,
+            _actor=approvals_api.ActorContext(actor_type="user"),
+            since=(joined_at - timedelta(minutes=1)).isoformat(),
+        )
+        replayed = [
+            json.loads(event.data)["approval"]["id"]
+            async for event in response.body_iterator  # type: ignore[union-attr]
+        ]
+
+        # `unpublished` and `after` reach this client through the queue instead.
+        assert replayed == [str(before.id), str(published.id)]
+        assert board.id not in approvals_api._board_pollers
+    finally:
+        approvals_api._pending_counts.clear()
+        await engine.dispose()
+
+
+@pytest.mark.asyncio
+async def test_stream_drops_queued_versions_older_than_a_since_ahead_of_the_poller() -> None:
+    board = Board(id=uuid4(), organization_id=uuid4(), name="b", slug="b")
+    resumed_at = datetime(2026, 2, 1, 12, 0, 0)
+
+    class _Request:
+        def __init__(self) -> None:
+            self.checks = 0
+
+        async def is_disconnected(self) -> bool:
+            self.checks += 1
+            return self.checks > 2
+
+    # The poller's cursor trails the client's `since`, so no gap replay runs.
+    poller = approvals_api._ApprovalStreamPoller(board.id)
+    poller.last_seen = resumed_at - timedelta(minutes=5)
+    poller.task = asyncio.create_task(asyncio.Event().wait())
+    approvals_api._board_pollers[board.id] = poller
+
+    response = await approvals_api.stream_approvals(
+        request=_Request(),  # type: ignore[arg-type]
+        board=board,
+        _actor=approvals_api.ActorContext(actor_type="user"),
+        since=resumed_at.isoformat(),
+    )
+    stale = _item(
+        ServerSentEvent(event="approval", data="stale"),
+        updated_at=resumed_at - timedelta(seconds=1),
+    )
+    fresh = _item(ServerSentEvent(event="approval", data="fresh"), updated_at=resumed_at)
+
+    received: list[str] = []
+    iterator = response.body_iterator.__aiter__()  # type: ignore[union-attr]
+    first = asyncio.ensure_future(iterator.__anext__())
+    await asyncio.sleep(0)
+    poller._publish([stale, fresh])
+    received.append((await asyncio.wait_for(first, timeout=1)).data)
+    received.extend([event.data async for event in iterator])
+
+    assert received == ["fresh"]
+    assert board.id not in approvals_api._board_pollers
@@ -0,0 +1,42 @@
+# ruff: noqa: INP001
+"""Fire-and-forget background task helper behavior."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+
+import pytest
+
+from app.core import background
+
+
+@pytest.mark.asyncio
+async def test_spawn_background_logs_failures_and_releases_task(
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    async def _boom() -> None:
+        raise RuntimeError("gateway down")
+
+    task = background.spawn_background(_boom(), name="test.boom")
+    with caplog.at_level(logging.ERROR, logger=background.logger.name):
+        await background.drain_background_tasks(timeout=1)
+        await asyncio.sleep(0)
+
+    assert task.done()
+    assert task not in background._tasks
+    assert "background.task_failed name=test.boom" in caplog.text
+
+
+@pytest.mark.asyncio
+async def test_drain_background_tasks_cancels_stragglers() -> None:
+    release = asyncio.Event()
+
+    async def _slow() -> None:
+        await release.wait()
+
+    task = background.spawn_background(_slow(), name="test.slow")
+    await background.drain_background_tasks(timeout=0.01)
+
+    assert task.cancelled()
+    assert task not in background._tasks
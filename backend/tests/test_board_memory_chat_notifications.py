@@ -0,0 +1,166 @@
+# ruff: noqa: INP001
+"""Board chat notification fan-out and background dispatch."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from typing import Any
+from uuid import uuid4
+
+import pytest
+from sqlalchemy.ext.asyncio import create_async_engine
+from sqlmodel import SQLModel
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from app.api import board_memory as board_memory_api
+from app.api.deps import ActorContext
+from app.core.background import drain_background_tasks
+from app.models.agents import Agent
+from app.models.boards import Board
+from app.models.organizations import Organization
+from app.schemas.board_memory import BoardMemoryCreate
+from app.services.openclaw.gateway_rpc import GatewayConfig as GatewayClientConfig
+from app.services.openclaw.gateway_rpc import OpenClawGatewayError
+
+
+def _agent(board_id: object, name: str, *, session_id: str | None) -> Agent:
+    return Agent(
+        id=uuid4(),
+        board_id=board_id,
+        gateway_id=uuid4(),
+        name=name,
+        openclaw_session_id=session_id,
+    )
+
+
+class _ConcurrentDispatch:
+    """Completes a send only once every expected send is in flight."""
+
+    def __init__(self, expected: int) -> None:
+        self.expected = expected
+        self.started: list[str] = []
+        self.completed: list[str] = []
+        self.all_started = asyncio.Event()
+
+    async def try_send_agent_message(self, **kwargs: Any) -> OpenClawGatewayError | None:
+        self.started.append(kwargs["agent_name"])
+        if len(self.started) == self.expected:
+            self.all_started.set()
+        await self.all_started.wait()
+        if kwargs["agent_name"] == "Flaky":
+            return OpenClawGatewayError("gateway down")
+        if kwargs["agent_name"] == "Broken":
+            raise RuntimeError("unexpected send failure")
+        self.completed.append(kwargs["agent_name"])
+        return None
+
+
+@pytest.mark.asyncio
+async def test_send_to_agents_dispatches_concurrently_and_logs_failures(
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    board = Board(id=uuid4(), organization_id=uuid4(), name="Ops", slug="ops")
+    dispatch = _ConcurrentDispatch(expected=3)
+    messages = [
+        (_agent(board.id, "Worker", session_id="agent:worker"), "hi"),
+        (_agent(board.id, "Flaky", session_id="agent:flaky"), "hi"),
+        (_agent(board.id, "Broken", session_id="agent:broken"), "hi"),
+        (_agent(board.id, "Offline", session_id=None), "hi"),
+    ]
+
+    with caplog.at_level(logging.WARNING, logger=board_memory_api.logger.name):
+        await asyncio.wait_for(
+            board_memory_api._send_to_agents(
+                dispatch=dispatch,  # type: ignore[arg-type]
+                config=GatewayClientConfig(url="ws://gateway.example/ws", token=None),
+                board=board,
+                messages=messages,
+            ),
+            timeout=1,
+        )
+
+    assert sorted(dispatch.started) == ["Broken", "Flaky", "Worker"]
+    # A send that raises neither aborts its siblings nor escapes unlogged.
+    assert dispatch.completed == ["Worker"]
+    assert "board_memory.notify_failed" in caplog.text
+    assert str(messages[1][0].id) in caplog.text
+    assert f"agent_id={messages[2][0].id} error=unexpected send failure" in caplog.text
+
+
+@pytest.mark.asyncio
+async def test_create_chat_memory_notifies_targets_after_responding(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    async with engine.connect() as conn, conn.begin():
+        await conn.run_sync(SQLModel.metadata.create_all)
+    release = asyncio.Event()
+    notified: list[str] = []
+
+    async def _fake_notify(*, session: object, memory: Any, **_kwargs: Any) -> None:
+        await release.wait()
+        notified.append(memory.content)
+
+    monkeypatch.setattr(board_memory_api, "_notify_chat_targets", _fake_notify)
+    monkeypatch.setattr(board_memory_api, "async_session_maker", lambda: AsyncSession(engine))
+    try:
+        async with AsyncSession(engine, expire_on_commit=False) as session:
+            org_id = uuid4()
+            board = Board(id=uuid4(), organization_id=org_id, name="b", slug="b")
+            session.add(Organization(id=org_id, name=f"org-{org_id}"))
+            session.add(board)
+            await session.commit()
+
+            response = await board_memory_api.create_board_memory(
+                payload=BoardMemoryCreate(content="@worker ping", tags=["chat"]),
+                board=board,
+                session=session,
+                actor=ActorContext(actor_type="user"),
+            )
+
+        assert response.status_code == 200
+        assert notified == []
+        release.set()
+        await drain_background_tasks(timeout=1)
+        assert notified == ["@worker ping"]
+    finally:
+        await engine.dispose()
+
+
+@pytest.mark.asyncio
+async def test_chat_target_candidates_filters_in_sql_before_exact_match() -> None:
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    async with engine.connect() as conn, conn.begin():
+        await conn.run_sync(SQLModel.metadata.create_all)
+    try:
+        async with AsyncSession(engine, expire_on_commit=False) as session:
+            org_id = uuid4()
+            board = Board(id=uuid4(), organization_id=org_id, name="b", slug="b")
+            session.add(Organization(id=org_id, name=f"org-{org_id}"))
+            session.add(board)
+            lead = _agent(board.id, "Lead", session_id="agent:lead")
+            lead.is_board_lead = True
+            alex = _agent(board.id, "Alex Smith", session_id="agent:alex")
+            alexandra = _agent(board.id, "Alexandra", session_id="agent:alexandra")
+            bob = _agent(board.id, "Bob", session_id="agent:bob")
+            offline = _agent(board.id, "Alex", session_id=None)
+            session.add_all([lead, alex, alexandra, bob, offline])
+            await session.commit()
+
+            mentions = {"alex"}
+            candidates = await board_memory_api._chat_target_candidates(
+                session,
+                board_id=board.id,
+                mentions=mentions,
+            )
+            targets = board_memory_api._chat_targets(
+                agents=candidates,
+                mentions=mentions,
+                actor=ActorContext(actor_type="user"),
+            )
+
+            assert {agent.name for agent in candidates} == {"Lead", "Alex Smith", "Alexandra"}
+            assert {agent.name for agent in targets.values()} == {"Lead", "Alex Smith"}
+    finally:
+        await engine.dispose()
@@ -0,0 +1,366 @@
+# ruff: noqa: INP001
+"""Board memory stream fan-out and NOTIFY-driven fetch behavior."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+from datetime import datetime, timedelta
+from uuid import UUID, uuid4
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
+from sqlmodel import SQLModel
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from app.api import board_memory as board_memory_api
+from app.api.deps import ActorContext
+from app.db.notifications import PgNotificationListener
+from app.models.board_memory import BoardMemory
+from app.models.boards import Board
+from app.models.organizations import Organization
+from app.schemas.board_memory import BoardMemoryCreate, BoardMemoryRead
+
+
+async def _make_engine() -> AsyncEngine:
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    async with engine.connect() as conn, conn.begin():
+        await conn.run_sync(SQLModel.metadata.create_all)
+    return engine
+
+
+def _memory(board_id: UUID, *, is_chat: bool, created_at: datetime) -> BoardMemory:
+    return BoardMemory(
+        id=uuid4(),
+        board_id=board_id,
+        content="hello",
+        is_chat=is_chat,
+        created_at=created_at,
+    )
+
+
+def _memory_id(item: board_memory_api._MemoryStreamItem | None) -> str:
+    assert item is not None
+    lines = item.frame.decode().split("\r\n")
+    assert lines[:2] == [f"id: {item.memory_id}", "event: memory"]
+    assert lines[2].startswith("data: ")
+    return str(json.loads(lines[2].removeprefix("data: "))["memory"]["id"])
+
+
+@pytest.mark.asyncio
+async def test_fetch_memory_by_ids_skips_other_boards() -> None:
+    engine = await _make_engine()
+    try:
+        async with AsyncSession(engine, expire_on_commit=False) as session:
+            org_id = uuid4()
+            board = Board(id=uuid4(), organization_id=org_id, name="b", slug="b")
+            other = Board(id=uuid4(), organization_id=org_id, name="o", slug="o")
+            session.add(Organization(id=org_id, name=f"org-{org_id}"))
+            session.add_all([board, other])
+            await session.commit()
+            now = datetime(2026, 2, 1, 12, 0, 0)
+            wanted = _memory(board.id, is_chat=True, created_at=now)
+            foreign = _memory(other.id, is_chat=True, created_at=now)
+            session.add_all([wanted, foreign])
+            await session.commit()
+
+            memories = await board_memory_api._fetch_memory_by_ids(
+                session,
+                board.id,
+                {wanted.id, foreign.id},
+            )
+            assert [memory.id for memory in memories] == [wanted.id]
+    finally:
+        await engine.dispose()
+
+
+@pytest.mark.asyncio
+async def test_board_memory_notification_fetches_only_notified_rows(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    listener = PgNotificationListener(None)
+    listener.connected = True
+    board_id = uuid4()
+    created_at = board_memory_api.utcnow() + timedelta(seconds=1)
+    chat = _memory(board_id, is_chat=True, created_at=created_at)
+    note = _memory(board_id, is_chat=False, created_at=created_at)
+    rows = {chat.id: chat, note.id: note}
+    fetched: list[set[UUID]] = []
+
+    class _NullSession:
+        async def __aenter__(self) -> object:
+            return object()
+
+        async def __aexit__(self, *_exc: object) -> None:
+            return None
+
+    async def _fake_by_ids(
+        _session: object,
+        _board_id: UUID,
+        memory_ids: set[UUID],
+    ) -> list[BoardMemory]:
+        fetched.append(set(memory_ids))
+        return [rows[memory_id] for memory_id in memory_ids]
+
+    async def _fail_range(*_args: object, **_kwargs: object) -> list[BoardMemory]:
+        raise AssertionError("range query should not run while push is connected")
+
+    monkeypatch.setattr(board_memory_api, "async_session_maker", _NullSession)
+    monkeypatch.setattr(board_memory_api, "_fetch_memory_by_ids", _fake_by_ids)
+    monkeypatch.setattr(board_memory_api, "_fetch_memory_events", _fail_range)
+    monkeypatch.setattr(board_memory_api, "notification_listener", listener)
+
+    broadcaster, everything = board_memory_api._subscribe_board_memory_stream(
+        board_id,
+        is_chat=None,
+    )
+    _, chat_only = board_memory_api._subscribe_board_memory_stream(board_id, is_chat=True)
+    try:
+        listener._dispatch("board_memory", f"{board_id}:{chat.id}")
+        listener._dispatch("board_memory", f"{uuid4()}:{uuid4()}")
+        assert _memory_id(await asyncio.wait_for(everything.get(), timeout=1)) == str(chat.id)
+        assert _memory_id(await asyncio.wait_for(chat_only.get(), timeout=1)) == str(chat.id)
+
+        listener._dispatch("board_memory", f"{board_id}:{note.id}")
+        assert _memory_id(await asyncio.wait_for(everything.get(), timeout=1)) == str(note.id)
+        await asyncio.sleep(0.05)
+        assert chat_only.empty()
+        assert fetched == [{chat.id}, {note.id}]
+    finally:
+        for queue in list(broadcaster.subscribers):
+            board_memory_api._unsubscribe_board_memory_stream(broadcaster, queue)
+    assert board_id not in board_memory_api._board_broadcasters
+
+
+def test_board_memory_broadcaster_skips_republished_boundary_rows() -> None:
+    broadcaster = board_memory_api._BoardMemoryBroadcaster(uuid4())
+    queue: board_memory_api.StreamQueue = asyncio.Queue(maxsize=4)
+    broadcaster.subscribers[queue] = None
+    created_at = broadcaster.last_seen + timedelta(seconds=1)
+    first = _memory(broadcaster.board_id, is_chat=False, created_at=created_at)
+    second = _memory(broadcaster.board_id, is_chat=False, created_at=created_at)
+    third = _memory(broadcaster.board_id, is_chat=False, created_at=created_at)
+
+    broadcaster._publish([first])
+    # An inclusive range query after a resync returns the boundary row again.
+    broadcaster._publish([first, second, third])
+
+    assert broadcaster.last_seen == created_at
+    assert broadcaster.boundary_ids == {first.id, second.id, third.id}
+    assert [_memory_id(queue.get_nowait()) for _ in range(queue.qsize())] == [
+        str(first.id),
+        str(second.id),
+        str(third.id),
+    ]
+
+
+def test_board_memory_broadcaster_disconnects_stalled_subscribers() -> None:
+    broadcaster = board_memory_api._BoardMemoryBroadcaster(uuid4())
+    stalled: board_memory_api.StreamQueue = asyncio.Queue(maxsize=2)
+    keeping_up: board_memory_api.StreamQueue = asyncio.Queue(maxsize=2)
+    broadcaster.subscribers.update({stalled: None, keeping_up: None})
+    start = broadcaster.last_seen
+    memories = [
+        _memory(broadcaster.board_id, is_chat=False, created_at=start + timedelta(seconds=index))
+        for index in range(1, 4)
+    ]
+
+    broadcaster._publish(memories[:2])
+    keeping_up.get_nowait()
+    keeping_up.get_nowait()
+    broadcaster._publish(memories[2:])
+
+    # The stalled queue is flushed down to the overflow marker and unsubscribed.
+    assert stalled.qsize() == 1
+    assert stalled.get_nowait() is None
+    assert list(broadcaster.subscribers) == [keeping_up]
+    assert _memory_id(keeping_up.get_nowait()) == str(memories[2].id)
+    assert broadcaster.overflowed_subscribers == 1
+
+    last = board_memory_api._memory_stream_item(memories[0])
+    overflow = board_memory_api._overflow_event(last, start)
+    assert overflow["event"] == "overflow"
+    assert json.loads(overflow["data"]) == {
+        "last_id": str(memories[0].id),
+        "last_seen": memories[0].created_at.isoformat(),
+    }
+
+
+@pytest.mark.asyncio
+async def test_replay_cursor_resolves_last_event_id_on_the_same_board() -> None:
+    engine = await _make_engine()
+    try:
+        async with AsyncSession(engine, expire_on_commit=False) as session:
+            org_id = uuid4()
+            board = Board(id=uuid4(), organization_id=org_id, name="b", slug="b")
+            other = Board(id=uuid4(), organization_id=org_id, name="o", slug="o")
+            session.add(Organization(id=org_id, name=f"org-{org_id}"))
+            session.add_all([board, other])
+            await session.commit()
+            memory = _memory(board.id, is_chat=True, created_at=datetime(2026, 2, 1, 12))
+            session.add(memory)
+            await session.commit()
+
+            cursor = await board_memory_api._replay_cursor(session, board.id, str(memory.id))
+            assert cursor is not None
+            assert cursor.id == memory.id
+            assert await board_memory_api._replay_cursor(session, other.id, str(memory.id)) is None
+            assert await board_memory_api._replay_cursor(session, board.id, "not-a-uuid") is None
+    finally:
+        await engine.dispose()
+
+
+@pytest.mark.asyncio
+async def test_replay_events_page_through_the_gap_on_short_sessions(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    engine = await _make_engine()
+    sessions_opened = 0
+
+    def _session_maker() -> AsyncSession:
+        nonlocal sessions_opened
+        sessions_opened += 1
+        return AsyncSession(engine, expire_on_commit=False)
+
+    monkeypatch.setattr(board_memory_api, "async_session_maker", _session_maker)
+    monkeypatch.setattr(board_memory_api, "REPLAY_BATCH_SIZE", 2)
+    try:
+        async with AsyncSession(engine, expire_on_commit=False) as session:
+            org_id = uuid4()
+            board = Board(id=uuid4(), organization_id=org_id, name="b", slug="b")
+            session.add(Organization(id=org_id, name=f"org-{org_id}"))
+            session.add(board)
+            await session.commit()
+            since = datetime(2026, 2, 1, 12)
+            # Rows sharing a timestamp straddle a batch boundary.
+            gap = [
+                _memory(board.id, is_chat=True, created_at=since),
+                _memory(board.id, is_chat=True, created_at=since + timedelta(seconds=1)),
+                _memory(board.id, is_chat=True, created_at=since + timedelta(seconds=1)),
+                _memory(board.id, is_chat=True, created_at=since + timedelta(seconds=2)),
+            ]
+            note = _memory(board.id, is_chat=False, created_at=since + timedelta(seconds=1))
+            later = _memory(board.id, is_chat=True, created_at=since + timedelta(seconds=3))
+            session.add_all([*gap, note, later])
+            await session.commit()
+
+        replayed = [
+            memory.id
+            async for memory in board_memory_api._iter_replay_events(
+                board.id,
+                since,
+                since + timedelta(seconds=2),
+                is_chat=True,
+            )
+        ]
+
+        tied = sorted([gap[1], gap[2]], key=lambda memory: str(memory.id))
+        assert replayed == [gap[0].id, *(memory.id for memory in tied), gap[3].id]
+        assert sessions_opened == 3
+    finally:
+        await engine.dispose()
+
+
+def test_serialized_memory_matches_pydantic_json_mode() -> None:
+    memory = BoardMemory(
+        board_id=uuid4(),
+        content="deploy finished",
+        tags=["chat"],
+        is_chat=True,
+        source="Lead",
+        created_at=datetime(2026, 2, 1, 12, 30, 5, 123456),
+    )
+
+    expected = BoardMemoryRead.model_validate(memory, from_attributes=True).model_dump(
+        mode="json",
+    )
+    assert json.loads(board_memory_api._serialize_memory(memory)) == {"memory": expected}
+
+
+@pytest.mark.asyncio
+async def test_create_board_memory_returns_prebuilt_read_payload() -> None:
+    engine = await _make_engine()
+    try:
+        async with AsyncSession(engine, expire_on_commit=False) as session:
+            org_id = uuid4()
+            board = Board(id=uuid4(), organization_id=org_id, name="b", slug="b")
+            session.add(Organization(id=org_id, name=f"org-{org_id}"))
+            session.add(board)
+            await session.commit()
+
+            response = await board_memory_api.create_board_memory(
+                payload=BoardMemoryCreate(content="runbook updated", tags=["ops"]),
+                board=board,
+                session=session,
+                actor=ActorContext(actor_type="user"),
+            )
+
+            stored = await BoardMemory.objects.filter_by(board_id=board.id).first(session)
+            assert stored is not None
+            expected = BoardMemoryRead.model_validate(stored, from_attributes=True)
+            assert json.loads(response.body) == expected.model_dump(mode="json")
+    finally:
+        await engine.dispose()
+
+
+@pytest.mark.asyncio
+async def test_last_event_id_replay_leaves_rows_the_broadcaster_will_deliver_to_the_queue(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    engine = await _make_engine()
+    monkeypatch.setattr(
+        board_memory_api,
+        "async_session_maker",
+        lambda: AsyncSession(engine, expire_on_commit=False),
+    )
+
+    class _DisconnectedRequest:
+        async def is_disconnected(self) -> bool:
+            return True
+
+    try:
+        async with AsyncSession(engine, expire_on_commit=False) as session:
+            org_id = uuid4()
+            board = Board(id=uuid4(), organization_id=org_id, name="b", slug="b")
+            session.add(Organization(id=org_id, name=f"org-{org_id}"))
+            session.add(board)
+            await session.commit()
+            joined_at = datetime(2026, 2, 1, 12, 0, 0)
+            seen, before, published, unpublished, after = (
+                _memory(board.id, is_chat=True, created_at=created_at)
+                for created_at in (
+                    joined_at - timedelta(seconds=2),
+                    joined_at - timedelta(seconds=1),
+                    joined_at,
+                    joined_at,
+                    joined_at + timedelta(seconds=1),
+                )
+            )
+            session.add_all([seen, before, published, unpublished, after])
+            await session.commit()
+
+        # A broadcaster that already published one row at its cursor, and is idle.
+        broadcaster = board_memory_api._BoardMemoryBroadcaster(board.id)
+        broadcaster.last_seen = joined_at
+        broadcaster.boundary_ids = {published.id}
+        broadcaster.task = asyncio.create_task(asyncio.Event().wait())
+        board_memory_api._board_broadcasters[board.id] = broadcaster
+
+        response = await board_memory_api.stream_board_memory(
+            _DisconnectedRequest(),  # type: ignore[arg-type]
+            board=board,
+            _actor=ActorContext(actor_type="user"),
+            since=None,
+            is_chat=None,
+            last_event_id=str(seen.id),
+        )
+        replayed = [
+            frame.decode().split("\r\n")[0]
+            async for frame in response.body_iterator  # type: ignore[union-attr]
+        ]
+
+        # `unpublished` and `after` reach this client through the queue instead.
+        assert replayed == [f"id: {before.id}", f"id: {published.id}"]
+        assert board.id not in board_memory_api._board_broadcasters
+    finally:
+        await engine.dispose()
@@ -142,3 +142,13 @@ async def test_delete_where_rolls_back_when_commit_fails() -> None:
 
     assert session.exec_calls == 1
     assert session.rollback_calls == 1
+
+
+def test_engine_options_size_the_pool_only_for_postgres() -> None:
+    options = db_session._engine_options("postgresql+psycopg://u:p@db:5432/app")
+    assert options["pool_pre_ping"] is True
+    assert options["pool_size"] == db_session.settings.db_pool_size
+    assert options["max_overflow"] == db_session.settings.db_max_overflow
+    assert options["connect_args"] == {"options": "-c jit=off"}
+
+    assert db_session._engine_options("sqlite+aiosqlite:///:memory:") == {"pool_pre_ping": True}
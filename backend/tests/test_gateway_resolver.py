@@ -0,0 +1,63 @@
+# ruff: noqa: INP001
+"""Board -> gateway resolution helpers."""
+
+from __future__ import annotations
+
+from typing import Any
+from uuid import uuid4
+
+import pytest
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import create_async_engine
+from sqlmodel import SQLModel
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from app.models.boards import Board
+from app.models.gateways import Gateway
+from app.models.organizations import Organization
+from app.services.openclaw.gateway_resolver import get_gateway_for_board
+
+
+@pytest.mark.asyncio
+async def test_get_gateway_for_board_reuses_gateway_within_one_session() -> None:
+    # Only repeat resolutions inside a single session are saved; each new session
+    # (one per chat POST or onboarding request) still queries once.
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    async with engine.connect() as conn, conn.begin():
+        await conn.run_sync(SQLModel.metadata.create_all)
+    try:
+        async with AsyncSession(engine, expire_on_commit=False) as session:
+            org_id = uuid4()
+            gateway = Gateway(
+                organization_id=org_id,
+                name="gw",
+                url="ws://gateway.example/ws",
+                workspace_root="/tmp",
+            )
+            session.add(Organization(id=org_id, name=f"org-{org_id}"))
+            session.add(gateway)
+            boards = [
+                Board(organization_id=org_id, name=name, slug=name, gateway_id=gateway.id)
+                for name in ("a", "b")
+            ]
+            foreign = Board(organization_id=uuid4(), name="c", slug="c", gateway_id=gateway.id)
+            session.add_all(boards)
+            await session.commit()
+            session.expunge_all()
+
+            selects: list[str] = []
+
+            def _record(*args: Any) -> None:
+                statement = args[2]
+                if statement.lstrip().upper().startswith("SELECT"):
+                    selects.append(statement)
+
+            event.listen(engine.sync_engine, "before_cursor_execute", _record)
+            resolved = [await get_gateway_for_board(session, board) for board in boards]
+            cross_org = await get_gateway_for_board(session, foreign)
+
+            assert [item.id if item else None for item in resolved] == [gateway.id] * 2
+            assert cross_org is None
+            assert len(selects) == 1
+    finally:
+        await engine.dispose()
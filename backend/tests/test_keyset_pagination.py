@@ -0,0 +1,152 @@
+# ruff: noqa: INP001
+"""Keyset (cursor) pagination helpers and the approval/memory list endpoints."""
+
+from __future__ import annotations
+
+from datetime import datetime, timedelta
+from uuid import uuid4
+
+import pytest
+from fastapi import HTTPException
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
+from sqlmodel import SQLModel
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from app.api import approvals as approvals_api
+from app.api import board_memory as board_memory_api
+from app.api.deps import ActorContext
+from app.db.pagination import (
+    KeysetParams,
+    decode_keyset_cursor,
+    encode_keyset_cursor,
+    keyset_params,
+)
+from app.models.approvals import Approval
+from app.models.board_memory import BoardMemory
+from app.models.boards import Board
+from app.models.organizations import Organization
+from app.schemas.board_memory import BoardMemoryRead
+from app.schemas.pagination import DefaultKeysetPage
+
+
+async def _make_engine() -> AsyncEngine:
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    async with engine.connect() as conn, conn.begin():
+        await conn.run_sync(SQLModel.metadata.create_all)
+    return engine
+
+
+async def _seed_board(session: AsyncSession) -> Board:
+    org_id = uuid4()
+    board = Board(id=uuid4(), organization_id=org_id, name="b", slug="b")
+    session.add(Organization(id=org_id, name=f"org-{org_id}"))
+    session.add(board)
+    await session.commit()
+    return board
+
+
+def test_keyset_cursor_round_trips() -> None:
+    created_at = datetime(2026, 2, 1, 12, 30, 15, 123456)
+    row_id = uuid4()
+
+    cursor = encode_keyset_cursor(created_at, row_id)
+
+    assert "=" not in cursor
+    assert decode_keyset_cursor(cursor) == (created_at, row_id)
+
+
+@pytest.mark.parametrize("cursor", ["not-base64!", "bm8tc2VwYXJhdG9y", "eHx5"])
+def test_keyset_params_rejects_malformed_cursor(cursor: str) -> None:
+    with pytest.raises(HTTPException) as exc:
+        keyset_params(limit=10, cursor=cursor)
+
+    assert exc.value.status_code == 422
+
+
+@pytest.mark.asyncio
+async def test_list_approvals_walks_pages_with_cursor() -> None:
+    engine = await _make_engine()
+    try:
+        async with AsyncSession(engine, expire_on_commit=False) as session:
+            board = await _seed_board(session)
+            base = datetime(2026, 2, 1, 12, 0, 0)
+            # Two rows share a timestamp so the id tie-breaker is exercised.
+            timestamps = [base, base, base + timedelta(minutes=1), base + timedelta(minutes=2)]
+            for created_at in timestamps:
+                session.add(
+                    Approval(
+                        board_id=board.id,
+                        action_type="task.execute",
+                        confidence=80,
+                        created_at=created_at,
+                    ),
+                )
+            await session.commit()
+
+            actor = ActorContext(actor_type="user")
+            first = await approvals_api.list_approvals(
+                status_filter=None,
+                board=board,
+                session=session,
+                _actor=actor,
+                params=KeysetParams(limit=3),
+            )
+            assert len(first.items) == 3
+            assert first.next_cursor is not None
+
+            second = await approvals_api.list_approvals(
+                status_filter=None,
+                board=board,
+                session=session,
+                _actor=actor,
+                params=keyset_params(limit=3, cursor=first.next_cursor),
+            )
+            assert len(second.items) == 1
+            assert second.next_cursor is None
+
+            seen = [item.id for item in [*first.items, *second.items]]
+            assert len(set(seen)) == 4
+            ordered = [(item.created_at, item.id) for item in [*first.items, *second.items]]
+            assert ordered == sorted(ordered, reverse=True)
+    finally:
+        await engine.dispose()
+
+
+@pytest.mark.asyncio
+async def test_list_board_memory_returns_single_page_without_cursor() -> None:
+    engine = await _make_engine()
+    try:
+        async with AsyncSession(engine, expire_on_commit=False) as session:
+            board = await _seed_board(session)
+            session.add(BoardMemory(board_id=board.id, content="kept"))
+            await session.commit()
+
+            response = await board_memory_api.list_board_memory(
+                is_chat=None,
+                board=board,
+                session=session,
+                _actor=ActorContext(actor_type="user"),
+                params=KeysetParams(limit=5),
+            )
+
+            page = DefaultKeysetPage[BoardMemoryRead].model_validate_json(response.body)
+            assert [item.content for item in page.items] == ["kept"]
+            assert page.limit == 5
+            assert page.next_cursor is None
+    finally:
+        await engine.dispose()
+
+
+@pytest.mark.asyncio
+async def test_board_memory_rejects_blank_content() -> None:
+    """List queries rely on the check constraint instead of filtering blank rows."""
+    engine = await _make_engine()
+    try:
+        async with AsyncSession(engine, expire_on_commit=False) as session:
+            board = await _seed_board(session)
+            session.add(BoardMemory(board_id=board.id, content="   "))
+            with pytest.raises(IntegrityError):
+                await session.commit()
+    finally:
+        await engine.dispose()
@@ -14,6 +14,10 @@ def test_extract_mentions_parses_tokens():
     assert extract_mentions("hi @Alex and @bob-2") == {"alex", "bob-2"}
 
 
+def test_extract_mentions_without_at_sign_is_empty():
+    assert extract_mentions("thanks, will do") == set()
+
+
 def test_matches_agent_mention_matches_first_name():
     agent = _agent("Alice Cooper")
     assert matches_agent_mention(agent, {"alice"}) is True